@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+WRO Python Robot Control System - Headless Grader
+Runs student programs against a level without opening a window
+
+Usage: python run_headless.py <level_id|level.json|level.toml> program1.py [program2.py ...]
+"""
+
+import sys
+import os
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.level_manager import LevelManager
+from src.core.headless import HeadlessSimulator
+from src.core.level_file import LEVEL_FILE_EXTENSIONS, load_level_file
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+
+    if sys.argv[1].endswith(LEVEL_FILE_EXTENSIONS):
+        try:
+            level = load_level_file(sys.argv[1])
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+    else:
+        try:
+            level_id = int(sys.argv[1])
+        except ValueError:
+            print(f"ERROR: Level must be a number or a level file, got {sys.argv[1]!r}")
+            sys.exit(1)
+        level = LevelManager().get_level(level_id)
+        if not level:
+            print(f"ERROR: Level {level_id} not found")
+            sys.exit(1)
+
+    simulator = HeadlessSimulator(level)
+    failed = False
+    for path in sys.argv[2:]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                source = f.read()
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Cannot read {path}: {e}")
+            failed = True
+            continue
+
+        result = simulator.run(source)
+
+        status = "PASS" if result['completed'] else "FAIL"
+        print(f"{status} {path}: score={result['score']} time={result['time']:.2f}s "
+              f"commands={result['commands']} objectives={result['objectives']}"
+              + (f" error={result['error']}" if result['error'] else ""))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
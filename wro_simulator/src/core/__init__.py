@@ -5,4 +5,9 @@ Core components for WRO Robot Control System
 from .constants import *
 from .robot import PythonRobot
 from .level import BaseLevel, Objective
-from .level_manager import LevelManager
+from .level_manager import LevelManager, LevelInfo
+from .level_file import FileLevel, load_level_file
+from .level_generator import LevelGenerator, generate_level
+from .headless import HeadlessSimulator
+from .fleet import RobotFleet
+from .events import EventBus
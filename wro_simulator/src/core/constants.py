@@ -10,6 +10,19 @@ CONSOLE_WIDTH = 400
 GAME_WIDTH = SCREEN_WIDTH - CONSOLE_WIDTH - SIDEBAR_WIDTH
 FPS = 60
 
+# Simulation timestep (fixed, independent of render FPS)
+SIM_SUBSTEPS = 2  # simulation steps per rendered frame at full speed
+SIM_DT = 1.0 / (FPS * SIM_SUBSTEPS)
+MAX_FRAME_TIME = 0.25  # longest frame fed to the simulation, in seconds
+SPEED_LEVELS = [1, 2, 5, 10, 100, 1000, None]  # time-warp multipliers, None = instant
+
+# Arena bounds (game area between sidebar and console, in pixels)
+ARENA_LEFT = SIDEBAR_WIDTH
+ARENA_TOP = 0
+ARENA_RIGHT = SIDEBAR_WIDTH + GAME_WIDTH
+ARENA_BOTTOM = SCREEN_HEIGHT
+OCCUPANCY_CELL = 5  # pixels per cell of the per-level occupancy bitmap
+
 # Modern Color Palette
 WHITE = (255, 255, 255)
 BLACK = (33, 37, 41)
@@ -44,8 +57,15 @@ HUD_TEXT = (33, 37, 41)
 
 # Robot settings
 ROBOT_SIZE = 20
+ROBOT_START_X = SIDEBAR_WIDTH + 100  # start pose of every level, in pixels
+ROBOT_START_Y = 100
 ROBOT_SPEED = 100  # pixels per second
 ANIMATION_SPEED = 200
+ROTATION_SPEED = 180  # degrees per second
+SENSOR_RANGE = 200  # pixels
+COLLISION_MARGIN = 0.01  # pixels left between robot and obstacle on contact
+COLLECT_RADIUS = 40  # pixels from robot centre to collectible items
+NOISE_BATCH = 256  # normal samples drawn at a time by the noise model
 
 # Grid settings
 GRID_SIZE = 50  # pixels per unit
@@ -53,6 +73,9 @@ UNIT_SIZE = 50  # 1 unit = 50 pixels
 
 # Game settings
 MAX_HISTORY = 50
+PATH_CACHE_SIZE = 256  # planned routes remembered per level
+ROUTE_EXACT_LIMIT = 12  # most items ordered exactly (Held-Karp); heuristics beyond
 MAX_OUTPUT_LINES = 100
+MAX_EVENT_BUFFER = 500
 MAX_VISIBLE_CONSOLE_LINES = 25
 CONSOLE_LINE_HEIGHT = 20
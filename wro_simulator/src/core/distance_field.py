@@ -0,0 +1,76 @@
+"""
+Distance field for WRO Robot Control System
+Signed distance from every cell of the arena to the nearest obstacle or wall
+"""
+
+import math
+from typing import Dict, Iterable
+import numpy as np
+from .constants import *
+
+
+class DistanceField:
+    """Signed distance (pixels) sampled at cell centres: negative inside obstacles.
+
+    The true distance changes by at most one pixel per pixel moved, so the
+    sample minus half a cell diagonal is a safe lower bound anywhere in the
+    cell. Sensors use that bound to sphere-trace: step forward by it until
+    close to something, then finish with an exact ray cast.
+    """
+
+    def __init__(self, values: np.ndarray, cell_size: float = OCCUPANCY_CELL):
+        self.values = values
+        self.flat = values.ravel().tolist()  # Python floats for fast scalar lookups
+        self.cell_size = cell_size
+        self.rows, self.cols = values.shape
+        self.margin = cell_size * math.sqrt(2) / 2
+        self.obstacle_count = 0
+
+    @classmethod
+    def from_obstacles(cls, obstacles: Iterable[Dict], cell_size: float = OCCUPANCY_CELL) -> 'DistanceField':
+        """Compute the field analytically, one obstacle at a time"""
+        obstacles = list(obstacles)
+        cols = math.ceil((ARENA_RIGHT - ARENA_LEFT) / cell_size)
+        rows = math.ceil((ARENA_BOTTOM - ARENA_TOP) / cell_size)
+        px = ARENA_LEFT + (np.arange(cols) + 0.5) * cell_size
+        py = ARENA_TOP + (np.arange(rows) + 0.5) * cell_size
+        px, py = np.meshgrid(px, py)
+
+        # Arena walls: distance to the nearest wall, negative outside
+        field = np.minimum(np.minimum(px - ARENA_LEFT, ARENA_RIGHT - px),
+                           np.minimum(py - ARENA_TOP, ARENA_BOTTOM - py))
+
+        for o in obstacles:
+            x0, y0 = o['x'], o['y']
+            x1, y1 = x0 + o['width'], y0 + o['height']
+            gap_x = np.maximum(np.maximum(x0 - px, px - x1), 0)
+            gap_y = np.maximum(np.maximum(y0 - py, py - y1), 0)
+            depth = np.minimum(np.minimum(px - x0, x1 - px), np.minimum(py - y0, y1 - py))
+            inside = (gap_x == 0) & (gap_y == 0)
+            np.minimum(field, np.where(inside, -depth, np.hypot(gap_x, gap_y)), out=field)
+
+        distance_field = cls(field, cell_size)
+        distance_field.obstacle_count = len(obstacles)
+        return distance_field
+
+    def sample(self, x: float, y: float) -> float:
+        """Field value of the cell containing a point (-inf outside the arena)"""
+        col = int((x - ARENA_LEFT) // self.cell_size)
+        row = int((y - ARENA_TOP) // self.cell_size)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return -math.inf
+        return self.flat[row * self.cols + col]
+
+    def safe_distance(self, x: float, y: float) -> float:
+        """Lower bound on the distance from a point to any obstacle or wall"""
+        return self.sample(x, y) - self.margin
+
+    def sphere_trace(self, ox: float, oy: float, dx: float, dy: float, max_distance: float) -> float:
+        """How far along a unit ray is certainly free, stopping within a cell of contact"""
+        t = 0.0
+        while t < max_distance:
+            step = self.safe_distance(ox + dx * t, oy + dy * t)
+            if step < self.cell_size:
+                break
+            t += step
+        return min(t, max_distance)
@@ -0,0 +1,121 @@
+"""
+Event bus for WRO Robot Control System
+Structured, buffered simulation events replacing print() in hot paths
+"""
+
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from .constants import MAX_EVENT_BUFFER
+
+# Event kinds
+MOVE = 'move'            # forward/backward issued
+TURN = 'turn'            # left/right issued
+ARRIVED = 'arrived'      # a queued motion segment finished
+COLLISION = 'collision'  # a move was stopped by an obstacle
+SENSOR = 'sensor'        # any sensor reading
+COLLECT = 'collect'      # collect() called
+HISTORY = 'history'      # undo, redo or reset
+LEVEL = 'level'          # level started / completed
+OBJECTIVE = 'objective'  # objective progress
+MESSAGE = 'message'      # anything else worth showing
+ALL_KINDS = (MOVE, TURN, ARRIVED, COLLISION, SENSOR, COLLECT, HISTORY, LEVEL, OBJECTIVE, MESSAGE)
+
+# Levels
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+SILENT = 100
+
+
+class Event:
+    """One simulation event; its text is only formatted when first read"""
+
+    __slots__ = ('kind', 'level', 'template', 'args', 'data', '_text')
+
+    def __init__(self, kind: str, level: int, template: str, args: tuple, data: Dict[str, Any]):
+        self.kind = kind
+        self.level = level
+        self.template = template
+        self.args = args
+        self.data = data
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.template.format(*self.args) if self.args else self.template
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"Event({self.kind!r}, {self.text!r})"
+
+
+class EventBus:
+    """Publishes events to subscribers and keeps the most recent ones.
+
+    Log subscribers (no kinds given) and the buffer only receive events at
+    or above min_level; kind subscribers always receive their kinds. When
+    nobody wants an event, emit() returns before building it.
+    """
+
+    def __init__(self, capacity: int = MAX_EVENT_BUFFER):
+        self.buffer = deque(maxlen=capacity)
+        self.min_level = INFO
+        self.log_listeners: List[Callable[[Event], None]] = []
+        self.kind_listeners: Dict[str, List[Callable[[Event], None]]] = {}
+
+    @property
+    def quiet(self) -> bool:
+        return self.min_level >= SILENT
+
+    @quiet.setter
+    def quiet(self, quiet: bool):
+        """Quiet mode for batch runs: no log output, kind subscribers only"""
+        self.min_level = SILENT if quiet else INFO
+
+    def subscribe(self, callback: Callable[[Event], None], kinds: Optional[Iterable[str]] = None):
+        """Receive every logged event, or only the given kinds"""
+        if kinds is None:
+            self.log_listeners.append(callback)
+        else:
+            for kind in kinds:
+                self.kind_listeners.setdefault(kind, []).append(callback)
+
+    def unsubscribe(self, callback: Callable[[Event], None]):
+        if callback in self.log_listeners:
+            self.log_listeners.remove(callback)
+        for listeners in self.kind_listeners.values():
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def emit(self, kind: str, template: str, *args: Any, level: int = INFO, **data: Any):
+        """Publish an event; template is str.format()-ed with args on demand"""
+        logged = level >= self.min_level
+        listeners = self.kind_listeners.get(kind)
+        if not logged and not listeners:
+            return
+
+        event = Event(kind, level, template, args, data)
+        if logged:
+            self.buffer.append(event)
+            for callback in self.log_listeners:
+                callback(event)
+        if listeners:
+            for callback in listeners:
+                callback(event)
+
+    def lines(self) -> List[str]:
+        """Text of the buffered events, oldest first"""
+        return [event.text for event in self.buffer]
+
+    def clear(self):
+        self.buffer.clear()
+
+
+def print_event(event: Event):
+    """Subscriber that writes events to stdout"""
+    print(event.text)
@@ -0,0 +1,135 @@
+"""
+Robot fleet for WRO Robot Control System
+Struct-of-arrays storage so many robots share one vectorized update
+"""
+
+from typing import Dict, List, Optional
+import numpy as np
+from .constants import *
+from .robot import PythonRobot
+from .spatial_index import ObstacleGrid
+from .occupancy import OccupancyGrid
+from .distance_field import DistanceField
+
+
+def fleet_field(name: str, cast=float):
+    """Property that reads/writes one robot's slot in a fleet array"""
+    def getter(self):
+        return cast(getattr(self.fleet, name)[self.index])
+
+    def setter(self, value):
+        getattr(self.fleet, name)[self.index] = value
+
+    return property(getter, setter)
+
+
+class FleetRobot(PythonRobot):
+    """PythonRobot view whose pose and targets live in the fleet's arrays.
+
+    All commands, sensors and callbacks work as on a normal robot; only the
+    animation step is done for the whole fleet by RobotFleet.update().
+    Movement trails are not recorded for fleet robots.
+    """
+
+    x = fleet_field('x')
+    y = fleet_field('y')
+    angle = fleet_field('angle')
+    target_x = fleet_field('target_x')
+    target_y = fleet_field('target_y')
+    target_angle = fleet_field('target_angle')
+    animating = fleet_field('animating', bool)
+    sim_time = fleet_field('sim_time')
+    prev_x = fleet_field('prev_x')
+    prev_y = fleet_field('prev_y')
+    prev_angle = fleet_field('prev_angle')
+
+    def __init__(self, fleet: 'RobotFleet', index: int):
+        self.fleet = fleet
+        self.index = index
+        super().__init__(float(fleet.x[index]), float(fleet.y[index]))
+
+
+class RobotFleet:
+    """N robots stored as contiguous NumPy arrays"""
+
+    def __init__(self, count: int, x: float = ROBOT_START_X, y: float = ROBOT_START_Y):
+        self.x = np.full(count, x, dtype=np.float64)
+        self.y = np.full(count, y, dtype=np.float64)
+        self.angle = np.zeros(count, dtype=np.float64)
+        self.target_x = self.x.copy()
+        self.target_y = self.y.copy()
+        self.target_angle = np.zeros(count, dtype=np.float64)
+        self.animating = np.zeros(count, dtype=bool)
+        self.sim_time = np.zeros(count, dtype=np.float64)
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.prev_angle = self.angle.copy()
+        self.animation_speed = ANIMATION_SPEED
+
+        self.robots: List[FleetRobot] = [FleetRobot(self, i) for i in range(count)]
+
+    def __len__(self) -> int:
+        return len(self.robots)
+
+    def __getitem__(self, index: int) -> FleetRobot:
+        return self.robots[index]
+
+    def __iter__(self):
+        return iter(self.robots)
+
+    def set_obstacles(self, obstacles: List[Dict], index: Optional[ObstacleGrid] = None,
+                      occupancy: Optional[OccupancyGrid] = None,
+                      distance_field: Optional[DistanceField] = None):
+        """Give every robot the same obstacles and shared lookup structures"""
+        if index is None:
+            index = ObstacleGrid.from_obstacles(obstacles)
+        if occupancy is None:
+            occupancy = OccupancyGrid.from_obstacles(obstacles, index)
+        if distance_field is None:
+            distance_field = DistanceField.from_obstacles(obstacles)
+        for robot in self.robots:
+            robot.set_obstacles(obstacles, index, occupancy, distance_field)
+
+    def set_items(self, items: List[Dict]):
+        """Give every robot its own copy of the collectible items"""
+        for robot in self.robots:
+            robot.items = items.copy()
+
+    def update(self, dt: float):
+        """Advance every animating robot by dt (same rules as PythonRobot.update)"""
+        self.sim_time += dt
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.prev_angle = self.angle.copy()
+        active = self.animating
+        if not active.any():
+            return
+
+        # Move towards target positions
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        distance = np.hypot(dx, dy)
+        move_distance = self.animation_speed * dt
+
+        arrive = active & ((distance <= 1) | (move_distance >= distance))
+        step = active & ~arrive
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(step, move_distance / distance, 0.0)
+        self.x = np.where(arrive, self.target_x, self.x + dx * ratio)
+        self.y = np.where(arrive, self.target_y, self.y + dy * ratio)
+
+        # Rotate towards target angles along the shorter direction
+        angle_diff = self.target_angle - self.angle
+        angle_diff = np.where(angle_diff > 180, angle_diff - 360, angle_diff)
+        angle_diff = np.where(angle_diff < -180, angle_diff + 360, angle_diff)
+        rotation_speed = ROTATION_SPEED * dt
+
+        settle = active & ((np.abs(angle_diff) <= 1) | (np.abs(angle_diff) <= rotation_speed))
+        rotate = active & ~settle
+        self.angle = np.where(settle, self.target_angle,
+                              np.where(rotate, self.angle + np.sign(angle_diff) * rotation_speed, self.angle))
+
+        # Finished robots stop and notify their objective callbacks
+        done = active & (distance <= 1) & (np.abs(angle_diff) <= 1)
+        for index in np.flatnonzero(done):
+            self.robots[index].finish_motion()
@@ -0,0 +1,130 @@
+"""
+Geometry helpers for WRO Robot Control System
+Exact ray casting against axis-aligned obstacles and arena walls
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+from .constants import SIDEBAR_WIDTH, UNIT_SIZE, ARENA_LEFT, ARENA_TOP, ARENA_RIGHT, ARENA_BOTTOM
+
+
+def pixel_to_grid(x: float, y: float) -> Tuple[float, float]:
+    """Screen pixels to grid units (origin at the top-left of the game area)"""
+    return (x - SIDEBAR_WIDTH) / UNIT_SIZE, y / UNIT_SIZE
+
+
+def grid_to_pixel(grid_x: float, grid_y: float) -> Tuple[float, float]:
+    """Grid units to screen pixels"""
+    return SIDEBAR_WIDTH + grid_x * UNIT_SIZE, grid_y * UNIT_SIZE
+
+
+def ray_rect_distance(ox: float, oy: float, dx: float, dy: float, rect: Dict) -> Optional[float]:
+    """Distance along a unit ray to an axis-aligned rectangle (slab method).
+
+    Returns None when the ray misses, and 0 when the origin is inside.
+    """
+    t_near = -math.inf
+    t_far = math.inf
+
+    for origin, direction, low, high in (
+        (ox, dx, rect['x'], rect['x'] + rect['width']),
+        (oy, dy, rect['y'], rect['y'] + rect['height'])
+    ):
+        if direction == 0:
+            # Parallel to this slab: hit only if the origin lies within it
+            if origin < low or origin > high:
+                return None
+            continue
+
+        t1 = (low - origin) / direction
+        t2 = (high - origin) / direction
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_near = max(t_near, t1)
+        t_far = min(t_far, t2)
+        if t_near > t_far:
+            return None
+
+    if t_far < 0:
+        return None
+    return max(t_near, 0.0)
+
+
+def ray_bounds_distance(ox: float, oy: float, dx: float, dy: float,
+                        left: float, top: float, right: float, bottom: float) -> float:
+    """Distance along a unit ray from inside a box to the box boundary"""
+    distance = math.inf
+    if dx > 0:
+        distance = min(distance, (right - ox) / dx)
+    elif dx < 0:
+        distance = min(distance, (left - ox) / dx)
+    if dy > 0:
+        distance = min(distance, (bottom - oy) / dy)
+    elif dy < 0:
+        distance = min(distance, (top - oy) / dy)
+    return max(distance, 0.0)
+
+
+def circle_rect_overlap(cx: float, cy: float, radius: float, rect: Dict) -> bool:
+    """Whether a circle strictly overlaps a rectangle (touching does not count)"""
+    nearest_x = min(max(cx, rect['x']), rect['x'] + rect['width'])
+    nearest_y = min(max(cy, rect['y']), rect['y'] + rect['height'])
+    return (cx - nearest_x) ** 2 + (cy - nearest_y) ** 2 < radius * radius - 1e-9
+
+
+def circle_path_clear(index, x0: float, y0: float, x1: float, y1: float, radius: float) -> bool:
+    """Whether a circle can move straight from (x0, y0) to (x1, y1) inside the arena.
+
+    index is an ObstacleGrid; only obstacles near the path are swept.
+    """
+    for x, y in ((x0, y0), (x1, y1)):
+        if not (ARENA_LEFT + radius <= x <= ARENA_RIGHT - radius and
+                ARENA_TOP + radius <= y <= ARENA_BOTTOM - radius):
+            return False
+    dx, dy = x1 - x0, y1 - y0
+    candidates = index.query_rect(min(x0, x1) - radius, min(y0, y1) - radius,
+                                  abs(dx) + 2 * radius, abs(dy) + 2 * radius)
+    return all(not circle_rect_overlap(x0, y0, radius, o) and
+               sweep_circle_rect(x0, y0, dx, dy, radius, o) is None for o in candidates)
+
+
+def sweep_circle_rect(x0: float, y0: float, dx: float, dy: float,
+                      radius: float, rect: Dict) -> Optional[float]:
+    """Time of impact in [0, 1] of a circle moving by (dx, dy) into a rectangle.
+
+    The rectangle is grown by the radius (a rounded rectangle) and the centre
+    is traced as a ray against it. Returns None when the move stays clear, or
+    when the circle already overlaps the rectangle so it can back away.
+    """
+    if circle_rect_overlap(x0, y0, radius, rect):
+        return None
+
+    left, top = rect['x'], rect['y']
+    right, bottom = left + rect['width'], top + rect['height']
+    grown = {'x': left - radius, 'y': top - radius,
+             'width': rect['width'] + 2 * radius, 'height': rect['height'] + 2 * radius}
+    t = ray_rect_distance(x0, y0, dx, dy, grown)
+    if t is None or t > 1:
+        return None
+
+    # Entry through a flat side of the grown box is the real contact point
+    hit_x = x0 + dx * t
+    hit_y = y0 + dy * t
+    corner_x = left if hit_x < left else right if hit_x > right else None
+    corner_y = top if hit_y < top else bottom if hit_y > bottom else None
+    if corner_x is None or corner_y is None:
+        return t
+
+    # Entry through a corner square: intersect with the rounded corner instead
+    fx = x0 - corner_x
+    fy = y0 - corner_y
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+    discriminant = b * b - 4 * a * c
+    if a == 0 or discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+    return t
@@ -4,49 +4,19 @@ Base Level class for WRO Robot Control System
 
 import math
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-
-
-class Objective:
-    """Represents a level objective"""
-    
-    def __init__(self, obj_type: str, description: str, **kwargs):
-        self.type = obj_type
-        self.description = description
-        self.params = kwargs
-        self.completed = False
-    
-    def check_completion(self, robot) -> bool:
-        """Check if objective is completed"""
-        if self.type == 'reach_target':
-            target = self.params.get('target', (10, 10))
-            tolerance = self.params.get('tolerance', 1.0)
-
-            # Convert robot pixel position to grid coordinates (accounting for sidebar)
-            from .constants import UNIT_SIZE, SIDEBAR_WIDTH
-            robot_grid_x = (robot.x - SIDEBAR_WIDTH) / UNIT_SIZE
-            robot_grid_y = robot.y / UNIT_SIZE
-            robot_pos = (robot_grid_x, robot_grid_y)
-
-            distance = math.sqrt((robot_pos[0] - target[0])**2 + (robot_pos[1] - target[1])**2)
-            return distance <= tolerance
-            
-        elif self.type == 'collect_items':
-            required = self.params.get('count', 1)
-            return robot.items_collected >= required
-            
-        elif self.type == 'avoid_obstacles':
-            return True  # Simplified for now
-            
-        elif self.type == 'use_sensors':
-            required_calls = self.params.get('sensor_calls', 1)
-            return robot.sensor_calls >= required_calls
-            
-        elif self.type == 'efficient_path':
-            max_commands = self.params.get('max_commands', 10)
-            return robot.commands_executed <= max_commands
-            
-        return False
+from typing import List, Dict, Any, Optional, Tuple
+from .spatial_index import ObstacleGrid
+from .occupancy import OccupancyGrid
+from .distance_field import DistanceField
+from .pathfinding import PathPlanner
+from .visibility import VisibilityGraph
+from .routing import RouteOptimizer
+from .orienteering import OrienteeringSolver
+from .program import Command, path_to_commands
+from .geometry import grid_to_pixel, pixel_to_grid
+from .objective_tracker import ObjectiveTracker
+from .objectives import Objective, create_objective
+from .constants import ROBOT_START_X, ROBOT_START_Y, UNIT_SIZE, COLLECT_RADIUS
 
 
 class BaseLevel(ABC):
@@ -60,11 +30,18 @@ class BaseLevel(ABC):
         self.difficulty = 1  # 1-5 stars
         self.objectives: List[Objective] = []
         self.obstacles: List[Dict] = []
+        self.obstacle_index = ObstacleGrid()
+        self._occupancy: Optional[OccupancyGrid] = None
+        self._distance_field: Optional[DistanceField] = None
+        self._path_planner: Optional[PathPlanner] = None
+        self._visibility_graph: Optional[VisibilityGraph] = None
+        self._route_optimizer: Optional[RouteOptimizer] = None
         self.items: List[Dict] = []
         self.target_area: Optional[Dict] = None
         self.time_limit: Optional[float] = None
         self.allowed_commands: Optional[List[str]] = None
         self.hints: List[str] = []
+        self.tracker: Optional[ObjectiveTracker] = None
         self.completed = False
         self.best_score = 0
         self.best_time: Optional[float] = None
@@ -79,14 +56,147 @@ class BaseLevel(ABC):
     
     def add_objective(self, obj_type: str, description: str, **kwargs):
         """Add an objective to the level"""
-        objective = Objective(obj_type, description, **kwargs)
+        objective = create_objective(obj_type, description, **kwargs)
         self.objectives.append(objective)
     
     def add_obstacle(self, x: int, y: int, width: int, height: int):
         """Add an obstacle to the level"""
-        self.obstacles.append({
+        obstacle = {
             'x': x, 'y': y, 'width': width, 'height': height
-        })
+        }
+        self.obstacles.append(obstacle)
+        self.get_obstacle_index().insert(obstacle)
+        self._occupancy = None
+        self._distance_field = None
+        self._path_planner = None
+        self._visibility_graph = None
+        self._route_optimizer = None
+
+    def get_obstacle_index(self) -> ObstacleGrid:
+        """Spatial index over the obstacles (rebuilt if the list was replaced)"""
+        if len(self.obstacle_index) != len(self.obstacles):
+            self.obstacle_index = ObstacleGrid.from_obstacles(self.obstacles)
+        return self.obstacle_index
+
+    @property
+    def occupancy(self) -> OccupancyGrid:
+        """Occupancy bitmap of the arena (rebuilt if the obstacles changed)"""
+        if self._occupancy is None or self._occupancy.obstacle_count != len(self.obstacles):
+            self._occupancy = OccupancyGrid.from_obstacles(self.obstacles, self.get_obstacle_index())
+        return self._occupancy
+
+    @property
+    def distance_field(self) -> DistanceField:
+        """Signed distance field of the arena (computed once, rebuilt if the obstacles changed)"""
+        if self._distance_field is None or self._distance_field.obstacle_count != len(self.obstacles):
+            self._distance_field = DistanceField.from_obstacles(self.obstacles)
+        return self._distance_field
+
+    @property
+    def path_planner(self) -> PathPlanner:
+        """A* planner for this level; its route cache is shared by every run"""
+        if self._path_planner is None or self._path_planner.obstacle_count != len(self.obstacles):
+            self._path_planner = PathPlanner(self.distance_field, self.get_obstacle_index())
+        return self._path_planner
+
+    @property
+    def visibility_graph(self) -> VisibilityGraph:
+        """Corner visibility graph for near-optimal any-angle paths (built once)"""
+        if self._visibility_graph is None or self._visibility_graph.obstacle_count != len(self.obstacles):
+            self._visibility_graph = VisibilityGraph(self.obstacles, self.get_obstacle_index())
+        return self._visibility_graph
+
+    @property
+    def route_optimizer(self) -> RouteOptimizer:
+        """Item visiting-order optimizer; its distance memo is shared by every run"""
+        if self._route_optimizer is None or self._route_optimizer.graph is not self.visibility_graph:
+            self._route_optimizer = RouteOptimizer(self.visibility_graph)
+        return self._route_optimizer
+
+    def target_goal(self, target: Optional[Tuple[float, float]] = None) -> Optional[Tuple[float, float]]:
+        """Closest reachable pixel point within tolerance of a grid target (default: reach_target's)"""
+        tolerance = 1.0
+        if target is None:
+            objective = next((obj for obj in self.objectives if obj.type == 'reach_target'), None)
+            if objective is None:
+                return None
+            target = objective.params.get('target', (10, 10))
+            tolerance = objective.params.get('tolerance', 1.0)
+        goal_x, goal_y = grid_to_pixel(*target)
+        return self.visibility_graph.nearest_free(goal_x, goal_y, tolerance * UNIT_SIZE - 1)
+
+    def optimal_commands(self, target: Tuple[float, float]) -> Optional[List[Command]]:
+        """Turn/forward commands along the shortest route from the start pose to a grid target (par count)"""
+        goal = self.target_goal(target)
+        if goal is None:
+            return None
+        route = self.visibility_graph.shortest_path(ROBOT_START_X, ROBOT_START_Y, *goal)
+        if route is None:
+            return None
+        return path_to_commands(ROBOT_START_X, ROBOT_START_Y, 0, route)
+
+    def optimal_route(self) -> Dict[str, Any]:
+        """Shortest route from the start pose through every item, then to the target.
+
+        Returns the item order (indices into self.items), the route length
+        in units, its waypoints in grid units and the motion commands along
+        it. Items the robot cannot get close to are listed as skipped.
+        """
+        graph = self.visibility_graph
+        start = (ROBOT_START_X, ROBOT_START_Y)
+        stops, stop_items = [], []
+        for i, item in enumerate(self.items):
+            stop = graph.nearest_free(item['x'], item['y'], COLLECT_RADIUS - 1)
+            if stop is not None:
+                stops.append(stop)
+                stop_items.append(i)
+
+        end = self.target_goal()
+        order, length = self.route_optimizer.solve(start, stops, end)
+        waypoints = self.route_optimizer.waypoints(start, stops, order, end)
+        visited = [stop_items[i] for i in order]
+
+        return {
+            'order': visited,
+            'skipped': [i for i in range(len(self.items)) if i not in visited],
+            'length': length / UNIT_SIZE,
+            'waypoints': [pixel_to_grid(x, y) for x, y in waypoints],
+            'commands': path_to_commands(*start, 0, waypoints)
+        }
+
+    def best_plan(self, time_limit: Optional[float] = None) -> Dict[str, Any]:
+        """Most items collectable on the way to the target within a time limit.
+
+        The limit defaults to the level's time_challenge objective (or
+        time_limit). Returns the item order, the predicted simulated time
+        (a par time), its waypoints in grid units and the motion commands.
+        """
+        if time_limit is None:
+            objective = next((obj for obj in self.objectives if obj.type == 'time_challenge'), None)
+            time_limit = objective.params.get('time_limit', 60) if objective else self.time_limit
+        if time_limit is None:
+            time_limit = math.inf
+
+        graph = self.visibility_graph
+        start = (ROBOT_START_X, ROBOT_START_Y)
+        stops, stop_items = [], []
+        for i, item in enumerate(self.items):
+            stop = graph.nearest_free(item['x'], item['y'], COLLECT_RADIUS - 1)
+            if stop is not None:
+                stops.append(stop)
+                stop_items.append(i)
+
+        end = self.target_goal()
+        order, _, predicted_time = OrienteeringSolver(self.route_optimizer).solve(start, stops, time_limit, end)
+        waypoints = self.route_optimizer.waypoints(start, stops, order, end)
+
+        return {
+            'order': [stop_items[i] for i in order],
+            'items': len(order),
+            'time': predicted_time,
+            'waypoints': [pixel_to_grid(x, y) for x, y in waypoints],
+            'commands': path_to_commands(*start, 0, waypoints)
+        }
     
     def add_item(self, x: int, y: int, item_type: str = 'coin'):
         """Add a collectible item to the level"""
@@ -104,12 +214,27 @@ class BaseLevel(ABC):
         """Add a hint for the level"""
         self.hints.append(hint)
     
+    def track(self, robot) -> ObjectiveTracker:
+        """Follow this robot's events so progress is kept up to date incrementally"""
+        # Stop whichever tracker followed the robot before, even a previous level's
+        for old in (robot.tracker, self.tracker):
+            if old is not None and old.level.tracker is old:
+                old.detach()
+                old.level.tracker = None
+        self.tracker = robot.tracker = ObjectiveTracker(self, robot)
+        return self.tracker
+
     def is_completed(self, robot) -> bool:
         """Check if all objectives are completed"""
+        if self.tracker is not None and self.tracker.robot is robot:
+            return self.tracker.is_completed()
         return all(obj.check_completion(robot) for obj in self.objectives)
     
     def get_progress(self, robot) -> Dict[str, Any]:
-        """Get current progress on objectives"""
+        """Get current progress on objectives (cached while a tracker follows the robot)"""
+        if self.tracker is not None and self.tracker.robot is robot:
+            return self.tracker.progress
+
         progress = {
             'total_objectives': len(self.objectives),
             'completed_objectives': 0,
@@ -129,15 +254,15 @@ class BaseLevel(ABC):
         
         return progress
     
-    def get_score(self, time_taken: float, robot) -> int:
-        """Calculate score based on performance"""
+    def get_score(self, time_taken: float, robot, count: str = 'executed') -> int:
+        """Calculate score based on performance (count: 'executed' or 'raw' commands)"""
         base_score = 100
         
         # Time bonus (faster = better)
         time_bonus = max(0, 50 - int(time_taken))
         
         # Efficiency bonus (fewer commands = better)
-        efficiency_bonus = max(0, 20 - robot.commands_executed)
+        efficiency_bonus = max(0, 20 - robot.command_count(count))
         
         # Sensor usage bonus (using sensors = better)
         sensor_bonus = min(10, robot.sensor_calls * 2)
@@ -0,0 +1,394 @@
+"""
+Level files for WRO Robot Control System
+Levels written as JSON/TOML data, compiled to a binary cache that loads with mmap
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, List, Optional, Union
+from .level import BaseLevel
+from .objectives import OBJECTIVE_TYPES
+from .constants import SIDEBAR_WIDTH
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+LEVEL_FILE_EXTENSIONS = ('.json', '.toml')
+COMPILED_EXTENSION = '.wrol'
+COMPILED_MAGIC = b'WROL'
+COMPILED_VERSION = 1
+
+# magic, version, flags, source mtime_ns, source size, level_id, difficulty,
+# time_limit, target area (x, y, w, h), then the section counts: obstacles,
+# items, objectives, params, strings, hints, allowed commands, reserved
+HEADER = struct.Struct('<4sHHqqiid4d8I')
+HAS_TARGET = 1
+HAS_TIME_LIMIT = 2
+HAS_ALLOWED_COMMANDS = 4
+
+# Objective parameter kinds in the compiled param table
+INT, FLOAT, BOOL, STRING, INT_PAIR, FLOAT_PAIR, NONE = range(7)
+
+
+def read_level_spec(path: str) -> Dict[str, Any]:
+    """Parse a .json or .toml level file into a spec dict"""
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise ValueError(f"{path}: TOML level files need Python 3.11+")
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def rect(value: Union[List, Dict], what: str) -> List[float]:
+    """[x, y, width, height] from a list or a table with those keys"""
+    if isinstance(value, dict):
+        value = [value.get(key) for key in ('x', 'y', 'width', 'height')]
+    if len(value) != 4 or not all(isinstance(v, (int, float)) for v in value):
+        raise ValueError(f"{what} must be [x, y, width, height], got {value!r}")
+    return list(value)
+
+
+def item(value: Union[List, Dict]) -> List:
+    """[x, y, type] from a list or a table with those keys"""
+    if isinstance(value, dict):
+        value = [value.get('x'), value.get('y'), value.get('type', 'coin')]
+    if len(value) == 2:
+        value = [value[0], value[1], 'coin']
+    if len(value) != 3 or not all(isinstance(v, (int, float)) for v in value[:2]):
+        raise ValueError(f"item must be [x, y] or [x, y, type], got {value!r}")
+    return list(value)
+
+
+def apply_spec(level: BaseLevel, spec: Dict[str, Any]):
+    """Fill a level from a spec through the normal BaseLevel API.
+
+    Positions in level files are arena pixels: x is measured from the
+    sidebar's edge, so the sidebar offset the Python levels add by hand is
+    added here.
+    """
+    for key in ('level_id', 'name'):
+        if key not in spec:
+            raise ValueError(f"level file is missing '{key}'")
+    level.level_id = spec['level_id']
+    level.name = spec['name']
+    level.description = spec.get('description', "")
+    level.difficulty = spec.get('difficulty', 1)
+    level.time_limit = spec.get('time_limit')
+    level.allowed_commands = spec.get('allowed_commands')
+
+    for objective in spec.get('objectives', []):
+        params = dict(objective)
+        obj_type = params.pop('type', None)
+        if obj_type not in OBJECTIVE_TYPES:
+            raise ValueError(f"unknown objective type {obj_type!r}")
+        description = params.pop('description', obj_type)
+        if isinstance(params.get('target'), list):
+            params['target'] = tuple(params['target'])
+        level.add_objective(obj_type, description, **params)
+
+    for obstacle in spec.get('obstacles', []):
+        x, y, width, height = rect(obstacle, 'obstacle')
+        level.add_obstacle(SIDEBAR_WIDTH + x, y, width, height)
+    for entry in spec.get('items', []):
+        x, y, item_type = item(entry)
+        level.add_item(SIDEBAR_WIDTH + x, y, item_type)
+    if spec.get('target_area') is not None:
+        x, y, width, height = rect(spec['target_area'], 'target_area')
+        level.set_target_area(SIDEBAR_WIDTH + x, y, width, height)
+    for hint in spec.get('hints', []):
+        level.add_hint(hint)
+
+
+def level_to_spec(level: BaseLevel) -> Dict[str, Any]:
+    """Spec dict describing an existing level (e.g. to export a Python level)"""
+    def arena(area):
+        return [area['x'] - SIDEBAR_WIDTH, area['y'], area['width'], area['height']]
+
+    objectives = []
+    for objective in level.objectives:
+        entry = {'type': objective.type, 'description': objective.description}
+        for key, value in objective.params.items():
+            entry[key] = list(value) if isinstance(value, tuple) else value
+        objectives.append(entry)
+
+    spec = {
+        'level_id': level.level_id,
+        'name': level.name,
+        'description': level.description,
+        'difficulty': level.difficulty,
+        'objectives': objectives,
+        'obstacles': [arena(obstacle) for obstacle in level.obstacles],
+        'items': [[i['x'] - SIDEBAR_WIDTH, i['y'], i['type']] for i in level.items],
+        'hints': list(level.hints),
+    }
+    if level.target_area is not None:
+        spec['target_area'] = arena(level.target_area)
+    if level.time_limit is not None:
+        spec['time_limit'] = level.time_limit
+    if level.allowed_commands is not None:
+        spec['allowed_commands'] = list(level.allowed_commands)
+    return spec
+
+
+def save_level_file(level: BaseLevel, path: str):
+    """Write a level as a JSON level file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(level_to_spec(level), f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+class FileLevel(BaseLevel):
+    """Level built from a spec dict or a compiled level instead of a Python class"""
+
+    def __init__(self, source: Union[Dict[str, Any], 'CompiledLevel']):
+        self.source = source
+        super().__init__()
+
+    def setup_level(self):
+        if isinstance(self.source, CompiledLevel):
+            self.source.apply(self)
+        else:
+            apply_spec(self, self.source)
+
+
+def compiled_path(path: str) -> str:
+    """Where the compiled cache of a level file lives (next to it)"""
+    return os.path.splitext(path)[0] + COMPILED_EXTENSION
+
+
+def pack_param(value: Any, strings: List[str]):
+    """(kind, string index, v0, v1) of one objective parameter"""
+    if value is None:
+        return NONE, 0, 0.0, 0.0
+    if isinstance(value, bool):
+        return BOOL, 0, float(value), 0.0
+    if isinstance(value, int):
+        return INT, 0, float(value), 0.0
+    if isinstance(value, float):
+        return FLOAT, 0, value, 0.0
+    if isinstance(value, str):
+        strings.append(value)
+        return STRING, len(strings) - 1, 0.0, 0.0
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        kind = INT_PAIR if all(isinstance(v, int) for v in value) else FLOAT_PAIR
+        return kind, 0, float(value[0]), float(value[1])
+    raise ValueError(f"objective parameter {value!r} cannot be compiled")
+
+
+def compile_level(spec: Dict[str, Any], path: str, source_stat: Optional[os.stat_result] = None):
+    """Write the compiled form of a spec.
+
+    Layout after the header: obstacle rects, item positions and param values
+    as float64 arrays, then item types, the objective table (type,
+    description, first param, param count), the param table (key, kind,
+    string) and string end offsets as uint32, then the UTF-8 string blob.
+    The spec must already load with apply_spec().
+    """
+    strings = [spec['name'], spec.get('description', "")]
+    hints = spec.get('hints', [])
+    allowed = spec.get('allowed_commands')
+    strings.extend(hints)
+    strings.extend(allowed or [])
+
+    doubles = []
+    for obstacle in spec.get('obstacles', []):
+        doubles.extend(rect(obstacle, 'obstacle'))
+    items = [item(entry) for entry in spec.get('items', [])]
+    for x, y, _ in items:
+        doubles.extend((x, y))
+
+    words = []
+    for _, _, item_type in items:
+        strings.append(item_type)
+        words.append(len(strings) - 1)
+
+    objective_words = []
+    param_words = []
+    param_doubles = []
+    for objective in spec.get('objectives', []):
+        params = dict(objective)
+        strings.append(params.pop('type'))
+        strings.append(params.pop('description', strings[-1]))
+        objective_words.extend((len(strings) - 2, len(strings) - 1, len(param_words) // 3, len(params)))
+        for key, value in params.items():
+            strings.append(key)
+            key_index = len(strings) - 1
+            kind, string_index, v0, v1 = pack_param(value, strings)
+            param_words.extend((key_index, kind, string_index))
+            param_doubles.extend((v0, v1))
+    doubles.extend(param_doubles)
+    words.extend(objective_words)
+    words.extend(param_words)
+
+    blob = bytearray()
+    for text in strings:
+        blob += text.encode('utf-8')
+        words.append(len(blob))
+
+    flags = 0
+    target = [0.0] * 4
+    if spec.get('target_area') is not None:
+        flags |= HAS_TARGET
+        target = rect(spec['target_area'], 'target_area')
+    time_limit = spec.get('time_limit')
+    if time_limit is not None:
+        flags |= HAS_TIME_LIMIT
+    if allowed is not None:
+        flags |= HAS_ALLOWED_COMMANDS
+    mtime_ns, size = (source_stat.st_mtime_ns, source_stat.st_size) if source_stat else (0, 0)
+
+    header = HEADER.pack(
+        COMPILED_MAGIC, COMPILED_VERSION, flags, mtime_ns, size,
+        spec['level_id'], spec.get('difficulty', 1), time_limit or 0.0, *target,
+        len(spec.get('obstacles', [])), len(items), len(objective_words) // 4,
+        len(param_words) // 3, len(strings), len(hints), len(allowed or []), 0
+    )
+    data = header + struct.pack(f'<{len(doubles)}d', *doubles) + struct.pack(f'<{len(words)}I', *words) + blob
+
+    # Write next to the source and swap in, so readers never see half a file
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+class CompiledLevel:
+    """Read-only view of a compiled level file mapped into memory.
+
+    The geometry and tables are memoryview casts over the mapping; nothing
+    is parsed until apply() copies them into a level.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size:
+            self.mm.close()
+            raise ValueError(f"{path}: truncated compiled level")
+        (magic, version, self.flags, self.source_mtime_ns, self.source_size,
+         self.level_id, self.difficulty, self.time_limit, *self.target,
+         self.obstacle_count, self.item_count, self.objective_count, self.param_count,
+         self.string_count, self.hint_count, self.allowed_count, _) = HEADER.unpack_from(self.mm)
+        if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+            self.mm.close()
+            raise ValueError(f"{path}: not a compiled level (version {COMPILED_VERSION})")
+
+        view = memoryview(self.mm)
+        self.views = [view]
+        offset = HEADER.size
+
+        def section(fmt: str, count: int, size: int):
+            nonlocal offset
+            part = view[offset:offset + count * size].cast(fmt)
+            offset += count * size
+            self.views.append(part)
+            return part
+
+        self.obstacles = section('d', self.obstacle_count * 4, 8)
+        self.item_positions = section('d', self.item_count * 2, 8)
+        self.param_values = section('d', self.param_count * 2, 8)
+        self.item_types = section('I', self.item_count, 4)
+        self.objective_table = section('I', self.objective_count * 4, 4)
+        self.param_table = section('I', self.param_count * 3, 4)
+        self.string_ends = section('I', self.string_count, 4)
+        self.blob = view[offset:]
+        self.views.append(self.blob)
+
+    def string(self, index: int) -> str:
+        start = self.string_ends[index - 1] if index else 0
+        return str(self.blob[start:self.string_ends[index]], 'utf-8')
+
+    def param(self, index: int) -> Any:
+        kind = self.param_table[index * 3 + 1]
+        v0, v1 = self.param_values[index * 2], self.param_values[index * 2 + 1]
+        if kind == INT:
+            return int(v0)
+        if kind == FLOAT:
+            return v0
+        if kind == BOOL:
+            return bool(v0)
+        if kind == STRING:
+            return self.string(self.param_table[index * 3 + 2])
+        if kind == INT_PAIR:
+            return int(v0), int(v1)
+        if kind == FLOAT_PAIR:
+            return v0, v1
+        return None
+
+    def apply(self, level: BaseLevel):
+        """Fill a level from the mapped arrays through the normal BaseLevel API"""
+        level.level_id = self.level_id
+        level.name = self.string(0)
+        level.description = self.string(1)
+        level.difficulty = self.difficulty
+        level.time_limit = self.time_limit if self.flags & HAS_TIME_LIMIT else None
+        first_allowed = 2 + self.hint_count
+        level.allowed_commands = ([self.string(i) for i in range(first_allowed, first_allowed + self.allowed_count)]
+                                  if self.flags & HAS_ALLOWED_COMMANDS else None)
+
+        table = self.objective_table
+        for n in range(self.objective_count):
+            type_index, description_index, first, count = table[n * 4:n * 4 + 4]
+            params = {self.string(self.param_table[i * 3]): self.param(i) for i in range(first, first + count)}
+            level.add_objective(self.string(type_index), self.string(description_index), **params)
+
+        rects = self.obstacles
+        for n in range(0, len(rects), 4):
+            level.add_obstacle(SIDEBAR_WIDTH + rects[n], rects[n + 1], rects[n + 2], rects[n + 3])
+        positions = self.item_positions
+        for n in range(self.item_count):
+            level.add_item(SIDEBAR_WIDTH + positions[n * 2], positions[n * 2 + 1], self.string(self.item_types[n]))
+        if self.flags & HAS_TARGET:
+            x, y, width, height = self.target
+            level.set_target_area(SIDEBAR_WIDTH + x, y, width, height)
+        for i in range(2, first_allowed):
+            level.add_hint(self.string(i))
+
+    def is_current(self, source_stat: os.stat_result) -> bool:
+        """Was this compiled from the source file as it is now?"""
+        return (self.source_mtime_ns == source_stat.st_mtime_ns and
+                self.source_size == source_stat.st_size)
+
+    def close(self):
+        """Unmap the file (the level it was applied to stays valid)"""
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        self.mm.close()
+
+
+def load_level_file(path: str, use_cache: bool = True) -> FileLevel:
+    """Load a .json/.toml level, through its compiled cache when it is current.
+
+    A missing or outdated cache is rebuilt after parsing the source; if the
+    cache cannot be written (or the level holds parameters the compiled
+    form cannot store) the parsed level is still returned.
+    """
+    source_stat = os.stat(path)
+    cache_path = compiled_path(path)
+    if use_cache and os.path.exists(cache_path):
+        try:
+            compiled = CompiledLevel(cache_path)
+        except (OSError, ValueError):
+            compiled = None
+        if compiled is not None:
+            try:
+                if compiled.is_current(source_stat):
+                    return FileLevel(compiled)
+            finally:
+                compiled.close()
+
+    spec = read_level_spec(path)
+    level = FileLevel(spec)
+    if use_cache:
+        try:
+            compile_level(spec, cache_path, source_stat)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not write compiled level {cache_path}: {e}")
+    return level
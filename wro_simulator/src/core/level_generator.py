@@ -0,0 +1,298 @@
+"""
+Level generator for WRO Robot Control System
+Seeded random levels whose items and target are checked reachable by a grid flood fill
+"""
+
+import math
+import random
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .level import BaseLevel
+from .geometry import pixel_to_grid
+from .constants import *
+
+Point = Tuple[int, int]
+
+MAX_DIFFICULTY = 6
+MAX_ATTEMPTS = 20  # layouts tried before obstacles are thinned out
+SECONDS_PER_UNIT = UNIT_SIZE / ANIMATION_SPEED + 180 / ROTATION_SPEED  # a move plus a U-turn
+
+
+class MoveLattice:
+    """Grid points the robot can stand on, linked where a one-unit move is clear.
+
+    This is the world as seen by whole-unit forward()/backward() moves and
+    90 degree turns from the start pose. The robot is treated as a square of
+    half-size radius, so a point or move found clear here is clear in the
+    simulation too (the converse need not hold).
+    """
+
+    def __init__(self, obstacles: List[Dict], radius: float = ROBOT_SIZE):
+        self.radius = radius
+        # Points whose robot body stays inside the arena
+        self.x0 = math.ceil(radius / UNIT_SIZE)
+        self.y0 = math.ceil((ARENA_TOP + radius) / UNIT_SIZE)
+        self.x1 = math.floor((GAME_WIDTH - radius) / UNIT_SIZE)
+        self.y1 = math.floor((ARENA_BOTTOM - radius) / UNIT_SIZE)
+        self.cols = self.x1 + 1
+        self.rows = self.y1 + 1
+
+        self.blocked = set()
+        self.blocked_x = set()  # (gx, gy): the move to (gx + 1, gy) is blocked
+        self.blocked_y = set()  # (gx, gy): the move to (gx, gy + 1) is blocked
+        self._links = None
+        for obstacle in obstacles:
+            self.insert(obstacle)
+
+    def insert(self, obstacle: Dict):
+        """Block the points and moves the obstacle (grown by radius) touches"""
+        self._links = None
+        left = (obstacle['x'] - SIDEBAR_WIDTH - self.radius) / UNIT_SIZE
+        right = (obstacle['x'] - SIDEBAR_WIDTH + obstacle['width'] + self.radius) / UNIT_SIZE
+        top = (obstacle['y'] - self.radius) / UNIT_SIZE
+        bottom = (obstacle['y'] + obstacle['height'] + self.radius) / UNIT_SIZE
+        gx0, gx1 = math.ceil(left), math.floor(right)
+        gy0, gy1 = math.ceil(top), math.floor(bottom)
+
+        # A move's segment overlaps the box from one cell before it starts
+        for gy in range(gy0, gy1 + 1):
+            for gx in range(math.ceil(left - 1), gx1 + 1):
+                self.blocked_x.add((gx, gy))
+        for gx in range(gx0, gx1 + 1):
+            for gy in range(math.ceil(top - 1), gy1 + 1):
+                self.blocked_y.add((gx, gy))
+            for gy in range(gy0, gy1 + 1):
+                self.blocked.add((gx, gy))
+
+    def is_free(self, point: Point) -> bool:
+        gx, gy = point
+        return self.x0 <= gx <= self.x1 and self.y0 <= gy <= self.y1 and point not in self.blocked
+
+    @property
+    def links(self) -> List[List[int]]:
+        """Neighbours (one clear unit move away) of every point, by flat index gy * cols + gx.
+
+        Built once for repeated floods; blocked points have no links.
+        """
+        if self._links is None:
+            cols = self.cols
+            links = [[] for _ in range(cols * self.rows)]
+            blocked, blocked_x, blocked_y = self.blocked, self.blocked_x, self.blocked_y
+            # Moves are symmetric: link each point to its right and lower neighbour only
+            for gy in range(self.y0, self.y1 + 1):
+                for gx in range(self.x0, self.x1 + 1):
+                    if (gx, gy) in blocked:
+                        continue
+                    here = gy * cols + gx
+                    if gx < self.x1 and (gx + 1, gy) not in blocked and (gx, gy) not in blocked_x:
+                        links[here].append(here + 1)
+                        links[here + 1].append(here)
+                    if gy < self.y1 and (gx, gy + 1) not in blocked and (gx, gy) not in blocked_y:
+                        links[here].append(here + cols)
+                        links[here + cols].append(here)
+            self._links = links
+        return self._links
+
+    def search(self, start: Point, goals=()) -> Tuple[List[int], Optional[int]]:
+        """Breadth-first flood fill: unit moves to each flat index (-1 if unreached).
+
+        Stops early at the first point of goals it reaches, returned as well.
+        """
+        cols = self.cols
+        links = self.links
+        steps = [-1] * len(links)
+        first = start[1] * cols + start[0]
+        steps[first] = 0
+        goals = {gy * cols + gx for gx, gy in goals}
+        if first in goals:
+            return steps, first
+        queue = deque([first])
+        while queue:
+            here = queue.popleft()
+            distance = steps[here] + 1
+            for step in links[here]:
+                if steps[step] < 0:
+                    steps[step] = distance
+                    if step in goals:
+                        return steps, step
+                    queue.append(step)
+        return steps, None
+
+    def flood(self, start: Point) -> Dict[Point, int]:
+        """Unit moves from start to every reachable point"""
+        if not self.is_free(start):
+            return {}
+        cols = self.cols
+        steps, _ = self.search(start)
+        return {(here % cols, here // cols): distance for here, distance in enumerate(steps) if distance >= 0}
+
+    def nearest(self, start: Point, goals: List[Point]) -> Tuple[Point, int]:
+        """Closest goal by unit moves and its distance (the flood stops when it is found)"""
+        steps, goal = self.search(start, goals)
+        if goal is None:
+            raise ValueError(f"no goal reachable from {start}")
+        return (goal % self.cols, goal // self.cols), steps[goal]
+
+    @staticmethod
+    def points_near(x: float, y: float, reach: float) -> List[Point]:
+        """Lattice points within reach pixels of (x, y)"""
+        gx, gy = pixel_to_grid(x, y)
+        span = reach / UNIT_SIZE
+        return [(px, py)
+                for px in range(math.ceil(gx - span), math.floor(gx + span) + 1)
+                for py in range(math.ceil(gy - span), math.floor(gy + span) + 1)
+                if (px - gx) ** 2 + (py - gy) ** 2 < span * span]
+
+
+def start_point() -> Point:
+    gx, gy = pixel_to_grid(ROBOT_START_X, ROBOT_START_Y)
+    return round(gx), round(gy)
+
+
+def is_solvable(level: BaseLevel, radius: float = ROBOT_SIZE) -> bool:
+    """Whether whole-unit moves can collect the items and reach the target the objectives ask for"""
+    reachable = MoveLattice(level.obstacles, radius).flood(start_point())
+    items = sum(1 for item in level.items
+                if any(p in reachable for p in MoveLattice.points_near(item['x'], item['y'], COLLECT_RADIUS)))
+    for objective in level.objectives:
+        if objective.type == 'collect_items' and objective.params.get('count', 1) > items:
+            return False
+        if objective.type == 'reach_target':
+            target_x, target_y = objective.params.get('target', (10, 10))
+            tolerance = objective.params.get('tolerance', 1.0)
+            if not any((gx - target_x) ** 2 + (gy - target_y) ** 2 <= tolerance * tolerance
+                       for gx, gy in reachable):
+                return False
+    return True
+
+
+class GeneratedLevel(BaseLevel):
+    """Level built from a layout made by LevelGenerator"""
+
+    def __init__(self, layout: Dict[str, Any]):
+        self.layout = layout
+        super().__init__()
+
+    def setup_level(self):
+        layout = self.layout
+        self.level_id = layout['level_id']
+        self.name = layout['name']
+        self.description = layout['description']
+        self.difficulty = layout['difficulty']
+        self.seed = layout['seed']
+
+        for obj_type, description, params in layout['objectives']:
+            self.add_objective(obj_type, description, **params)
+        for x, y, width, height in layout['obstacles']:
+            self.add_obstacle(x, y, width, height)
+        for x, y in layout['items']:
+            self.add_item(x, y, 'coin')
+        self.set_target_area(*layout['target_area'])
+
+        self.add_hint("Every item and the target can be reached with whole-unit moves")
+        self.add_hint("Plan a route before you start moving")
+
+
+class LevelGenerator:
+    """Makes random, solvable levels from a seed and a difficulty (1-6).
+
+    Obstacles are blocks aligned half a unit off the grid, so the robot
+    fits between them on grid points. Items and the target are placed only
+    on points the flood fill from the start reaches; harder levels get
+    more obstacles and items and add sensor and time objectives.
+    """
+
+    def __init__(self, difficulty: int = 3, level_id: int = 0):
+        self.difficulty = max(1, min(MAX_DIFFICULTY, difficulty))
+        self.level_id = level_id
+
+    def layout(self, seed: int) -> Dict[str, Any]:
+        """Obstacles, items, target and objectives for a seed (deterministic)"""
+        rng = random.Random(seed)
+        difficulty = self.difficulty
+        start = start_point()
+        obstacle_count = 2 * difficulty
+        item_count = difficulty + 1
+
+        for attempt in range(MAX_ATTEMPTS + obstacle_count):
+            # Thin the obstacles out if the layouts keep walling the start in
+            count = max(0, obstacle_count - max(0, attempt - MAX_ATTEMPTS + 1))
+            obstacles = [self.random_obstacle(rng) for _ in range(count)]
+            lattice = MoveLattice([{'x': x, 'y': y, 'width': w, 'height': h} for x, y, w, h in obstacles])
+            reachable = lattice.flood(start)
+            if len(reachable) > item_count + 2:
+                break
+
+        # Target among the farthest quarter of the reachable points
+        points = sorted(p for p in reachable if p != start)
+        points.sort(key=reachable.get)
+        target = rng.choice(points[len(points) * 3 // 4:])
+        points.remove(target)
+        item_points = rng.sample(points, item_count)
+
+        jitter = UNIT_SIZE / 5
+        items = [(SIDEBAR_WIDTH + gx * UNIT_SIZE + rng.uniform(-jitter, jitter),
+                  gy * UNIT_SIZE + rng.uniform(-jitter, jitter)) for gx, gy in item_points]
+        required = item_count if difficulty <= 2 else math.ceil(item_count * 0.7)
+
+        objectives = [
+            ('collect_items', f'Collect at least {required} items', {'count': required}),
+            ('reach_target', f'Reach the target at {target}', {'target': target, 'tolerance': 1.0}),
+        ]
+        if difficulty >= 4:
+            objectives.append(('use_sensors', 'Use sensors at least 3 times', {'min_sensor_calls': 3}))
+        if difficulty >= 5:
+            time_limit = math.ceil(self.tour_units(lattice, start, item_points[:required], target)
+                                   * SECONDS_PER_UNIT)
+            objectives.append(('time_challenge', f'Complete mission in under {time_limit} seconds',
+                               {'time_limit': time_limit}))
+
+        return {
+            'level_id': self.level_id,
+            'name': f"Generated {difficulty}-{seed}",
+            'description': f"Random level (seed {seed}, difficulty {difficulty})",
+            'difficulty': difficulty,
+            'seed': seed,
+            'obstacles': obstacles,
+            'items': items,
+            'target_area': (SIDEBAR_WIDTH + (target[0] - 1) * UNIT_SIZE, (target[1] - 1) * UNIT_SIZE,
+                            2 * UNIT_SIZE, 2 * UNIT_SIZE),
+            'objectives': objectives,
+        }
+
+    def random_obstacle(self, rng: random.Random) -> Tuple[int, int, int, int]:
+        """A block of whole cells between grid lines, up to 1 + difficulty // 2 cells long"""
+        longest = 1 + self.difficulty // 2
+        cells_x, cells_y = rng.randint(1, longest), 1
+        if rng.random() < 0.5:
+            cells_x, cells_y = cells_y, cells_x
+        gx = rng.randint(0, GAME_WIDTH // UNIT_SIZE - cells_x)
+        gy = rng.randint(0, ARENA_BOTTOM // UNIT_SIZE - cells_y)
+        half = UNIT_SIZE // 2
+        return (SIDEBAR_WIDTH + gx * UNIT_SIZE + half, gy * UNIT_SIZE + half,
+                cells_x * UNIT_SIZE, cells_y * UNIT_SIZE)
+
+    @staticmethod
+    def tour_units(lattice: MoveLattice, start: Point, stops: List[Point], end: Point) -> int:
+        """Unit moves of a nearest-first tour through stops to end (an upper bound)"""
+        total = 0
+        here = start
+        remaining = list(stops)
+        while remaining:
+            here, steps = lattice.nearest(here, remaining)
+            remaining.remove(here)
+            total += steps
+        return total + lattice.nearest(here, [end])[1]
+
+    def generate(self, seed: int) -> GeneratedLevel:
+        return GeneratedLevel(self.layout(seed))
+
+    def generate_many(self, count: int, seed: int = 0) -> Iterator[GeneratedLevel]:
+        """Levels for seeds seed, seed + 1, ... seed + count - 1"""
+        for n in range(count):
+            yield self.generate(seed + n)
+
+
+def generate_level(seed: int, difficulty: int = 3, level_id: int = 0) -> GeneratedLevel:
+    """One random, solvable level"""
+    return LevelGenerator(difficulty, level_id).generate(seed)
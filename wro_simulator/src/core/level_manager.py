@@ -2,58 +2,162 @@
 Level Manager for WRO Robot Control System
 """
 
-import importlib
+import importlib.util
+import json
 import os
 from typing import Dict, List, Optional
 from .level import BaseLevel
+from .level_file import LEVEL_FILE_EXTENSIONS, load_level_file
+
+LEVELS_DIR = os.path.join(os.path.dirname(__file__), '..', 'levels')
+MANIFEST_FILE = os.path.join(LEVELS_DIR, '.manifest.json')
+MANIFEST_VERSION = 1
+
+
+class LevelInfo:
+    """What the level select screen needs to know about a level, without loading it"""
+
+    def __init__(self, level_id: int, file: str, name: str = "", description: str = "",
+                 difficulty: int = 1):
+        self.level_id = level_id
+        self.file = file  # e.g. 'level_01.py' or 'level_07.json'
+        self.name = name
+        self.description = description
+        self.difficulty = difficulty
+
+        # Progress this session
+        self.completed = False
+        self.best_score = 0
+        self.best_time: Optional[float] = None
+
+    @classmethod
+    def from_level(cls, level: BaseLevel, file: str) -> 'LevelInfo':
+        return cls(level.level_id, file, level.name, level.description, level.difficulty)
+
+    def to_dict(self) -> Dict:
+        return {'level_id': self.level_id, 'name': self.name,
+                'description': self.description, 'difficulty': self.difficulty}
 
 
 class LevelManager:
-    """Manages game levels and progression"""
+    """Manages game levels and progression.
+
+    Levels are listed from a manifest of their metadata, cached on disk and
+    refreshed only for level files whose modification time changed. A
+    level's module (or level file) is loaded the first time get_level()
+    asks for it.
+    """
     
-    def __init__(self):
-        self.levels: Dict[int, BaseLevel] = {}
+    def __init__(self, levels_dir: str = LEVELS_DIR, manifest_file: Optional[str] = MANIFEST_FILE):
+        self.levels_dir = levels_dir
+        self.manifest_file = manifest_file
+        self.levels: Dict[int, LevelInfo] = {}
+        self.loaded: Dict[int, BaseLevel] = {}  # instantiated on demand
         self.unlocked_levels: List[int] = []  # Will be populated after loading
         self.load_levels()
         # Unlock all loaded levels for free exploration
         self.unlocked_levels = list(self.levels.keys())
     
     def load_levels(self):
-        """Dynamically load all levels from the levels directory"""
-        levels_dir = os.path.join(os.path.dirname(__file__), '..', 'levels')
-        
-        if not os.path.exists(levels_dir):
+        """Discover the levels in the levels directory from the cached manifest"""
+        if not os.path.exists(self.levels_dir):
             print("Warning: Levels directory not found")
             return
         
-        # Get all Python files in levels directory
-        level_files = [f for f in os.listdir(levels_dir) 
-                      if f.startswith('level_') and f.endswith('.py')]
-        
+        # Python levels and data level files (JSON/TOML) in the levels directory
+        level_files = [f for f in os.listdir(self.levels_dir)
+                      if f.startswith('level_') and f.endswith(('.py',) + LEVEL_FILE_EXTENSIONS)]
+
+        cached = self.read_manifest()
+        entries = {}
         for level_file in sorted(level_files):
-            try:
-                # Extract level number from filename (e.g., level_01.py -> 1)
-                level_num = int(level_file.split('_')[1].split('.')[0])
-                
-                # Import the level module
-                module_name = f"src.levels.{level_file[:-3]}"
-                module = importlib.import_module(module_name)
-                
-                # Get the level class (should be named like Level01, Level02, etc.)
-                level_class_name = f"Level{level_num:02d}"
-                if hasattr(module, level_class_name):
-                    level_class = getattr(module, level_class_name)
-                    level_instance = level_class()
-                    self.levels[level_num] = level_instance
-                    print(f"Loaded Level {level_num}: {level_instance.name}")
-                else:
-                    print(f"Warning: Level class {level_class_name} not found in {level_file}")
-                    
-            except Exception as e:
-                print(f"Error loading level {level_file}: {e}")
+            mtime = os.path.getmtime(os.path.join(self.levels_dir, level_file))
+            entry = cached.get(level_file)
+            if entry is None or entry.get('mtime') != mtime:
+                # New or edited level: import it once to read its metadata
+                level = self.import_level(level_file)
+                if level is None:
+                    continue
+                entry = dict(LevelInfo.from_level(level, level_file).to_dict(), mtime=mtime)
+                self.loaded[level.level_id] = level
+            entries[level_file] = entry
+
+            info = LevelInfo(entry['level_id'], level_file, entry['name'],
+                             entry['description'], entry['difficulty'])
+            self.levels[info.level_id] = info
+
+        if entries != cached:
+            self.write_manifest(entries)
+
+    def read_manifest(self) -> Dict[str, Dict]:
+        """Cached metadata per level file name (empty if missing or outdated)"""
+        if not self.manifest_file or not os.path.exists(self.manifest_file):
+            return {}
+        try:
+            with open(self.manifest_file, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('levels', {})
+
+    def write_manifest(self, entries: Dict[str, Dict]):
+        if not self.manifest_file:
+            return
+        try:
+            with open(self.manifest_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'levels': entries}, f, indent=1, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: Could not write level manifest: {e}")
+
+    def import_level(self, level_file: str) -> Optional[BaseLevel]:
+        """Import a level module and instantiate its LevelXX class, or load a level file"""
+        module = os.path.splitext(level_file)[0]
+        try:
+            if not level_file.endswith('.py'):
+                return load_level_file(os.path.join(self.levels_dir, level_file))
+
+            # Extract level number from module name (e.g., level_01 -> 1)
+            level_num = int(module.split('_')[1])
+
+            # Load from the file itself so any levels_dir works; the module
+            # still lives in the levels package for its relative imports
+            package = __package__.rpartition('.')[0] + '.levels'
+            spec = importlib.util.spec_from_file_location(f"{package}.{module}",
+                                                          os.path.join(self.levels_dir, level_file))
+            module_obj = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module_obj)
+
+            # Get the level class (should be named like Level01, Level02, etc.)
+            level_class_name = f"Level{level_num:02d}"
+            if not hasattr(module_obj, level_class_name):
+                print(f"Warning: Level class {level_class_name} not found in {module}.py")
+                return None
+            return getattr(module_obj, level_class_name)()
+
+        except Exception as e:
+            print(f"Error loading level {level_file}: {e}")
+            return None
     
     def get_level(self, level_id: int) -> Optional[BaseLevel]:
-        """Get level by ID"""
+        """Get level by ID, importing its module on first use"""
+        if level_id not in self.loaded:
+            info = self.levels.get(level_id)
+            if info is None:
+                return None
+            level = self.import_level(info.file)
+            if level is None:
+                return None
+            self.loaded[level_id] = level
+
+        level = self.loaded[level_id]
+        info = self.levels[level_id]
+        level.completed, level.best_score, level.best_time = info.completed, info.best_score, info.best_time
+        return level
+
+    def get_info(self, level_id: int) -> Optional[LevelInfo]:
+        """Metadata and progress of a level (never imports it)"""
         return self.levels.get(level_id)
     
     def is_level_unlocked(self, level_id: int) -> bool:
@@ -68,7 +172,7 @@ class LevelManager:
     
     def complete_level(self, level_id: int, score: int, time_taken: float):
         """Mark level as completed and unlock next level"""
-        level = self.get_level(level_id)
+        level = self.get_info(level_id)
         if not level:
             return
         
@@ -76,6 +180,8 @@ class LevelManager:
         level.best_score = max(level.best_score, score)
         if level.best_time is None or time_taken < level.best_time:
             level.best_time = time_taken
+        if level_id in self.loaded:
+            self.get_level(level_id)  # copies the new progress onto the level
         
         # Unlock next level
         next_level = level_id + 1
@@ -107,6 +213,10 @@ class LevelManager:
             level.completed = False
             level.best_score = 0
             level.best_time = None
+        for level in self.loaded.values():
+            level.completed = False
+            level.best_score = 0
+            level.best_time = None
             level.reset()
     
     def get_next_level(self, current_level_id: int) -> Optional[int]:
@@ -0,0 +1,85 @@
+"""
+Noise model for WRO Robot Control System
+Seeded, replayable sensor and motor noise drawn from NumPy in batches
+"""
+
+from typing import Optional
+import numpy as np
+from .constants import *
+
+
+class NoiseModel:
+    """Gaussian sensor range noise, heading drift and wheel slip.
+
+    Standard normal samples are drawn NOISE_BATCH at a time from a seeded
+    generator and handed out in order, so a run with the same seed and the
+    same commands sees exactly the same noise. With every setting at zero
+    (the default) nothing is sampled and the robot stays deterministic.
+    """
+
+    def __init__(self, range_sigma: float = 0.0, heading_sigma: float = 0.0,
+                 slip: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            range_sigma: Standard deviation of distance sensor readings, in units
+            heading_sigma: Standard deviation of heading error per move or turn, in degrees
+            slip: Standard deviation of the distance travelled, as a fraction of the command
+            seed: Generator seed; a fresh one is chosen (and recorded) when omitted
+        """
+        self.range_sigma = range_sigma
+        self.heading_sigma = heading_sigma
+        self.slip = slip
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.samples = np.empty(0)
+        self.position = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.range_sigma or self.heading_sigma or self.slip)
+
+    def replay(self) -> 'NoiseModel':
+        """A fresh model with the same settings and seed"""
+        return NoiseModel(self.range_sigma, self.heading_sigma, self.slip, self.seed)
+
+    def normals(self, count: int) -> np.ndarray:
+        """The next count standard normal samples"""
+        if self.position + count > len(self.samples):
+            fresh = self.rng.standard_normal(max(NOISE_BATCH, count))
+            self.samples = np.concatenate((self.samples[self.position:], fresh))
+            self.position = 0
+        values = self.samples[self.position:self.position + count]
+        self.position += count
+        return values
+
+    def normal(self) -> float:
+        return float(self.normals(1)[0])
+
+    def range(self, distance: float) -> float:
+        """A noisy distance reading (units), kept within the sensor's range"""
+        if not self.range_sigma:
+            return distance
+        noisy = distance + self.range_sigma * self.normal()
+        return min(max(noisy, 0.0), SENSOR_RANGE / UNIT_SIZE)
+
+    def ranges(self, distances: np.ndarray) -> np.ndarray:
+        """Noisy readings for a whole scan, sampled in one batch"""
+        if not self.range_sigma:
+            return distances
+        noisy = distances + self.range_sigma * self.normals(len(distances))
+        return np.clip(noisy, 0.0, SENSOR_RANGE / UNIT_SIZE).astype(distances.dtype)
+
+    def move(self, distance: float):
+        """(distance actually travelled, heading error in degrees) for a move"""
+        if not (self.slip or self.heading_sigma):
+            return distance, 0.0
+        slip, drift = self.normals(2).tolist()
+        return distance * (1 + self.slip * slip), self.heading_sigma * drift
+
+    def turn(self, angle: float) -> float:
+        """Angle actually turned for a commanded turn"""
+        if not self.heading_sigma:
+            return angle
+        return angle + self.heading_sigma * self.normal()
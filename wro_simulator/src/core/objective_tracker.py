@@ -0,0 +1,74 @@
+"""
+Objective tracker for WRO Robot Control System
+Re-checks only the objectives a robot event can affect and caches the progress snapshot
+"""
+
+from typing import Any, Dict, List, Optional
+from .events import *
+
+
+class ObjectiveTracker:
+    """Keeps a level's progress snapshot up to date from one robot's events.
+
+    Events only mark the objectives that watch their kind (Objective.watches)
+    as stale; stale objectives are re-checked the next time progress is
+    read, so reading it every frame costs nothing while the robot is idle.
+    Volatile objectives (e.g. time limits) are re-checked on every read.
+    """
+
+    def __init__(self, level, robot):
+        self.level = level
+        self.robot = robot
+        self.watchers: Dict[str, List[int]] = {}
+        for index, objective in enumerate(level.objectives):
+            for kind in objective.watches:
+                self.watchers.setdefault(kind, []).append(index)
+
+        self.results: List[bool] = [False] * len(level.objectives)
+        self.volatile = [index for index, objective in enumerate(level.objectives) if objective.volatile]
+        self.stale = set(range(len(level.objectives)))
+        self._progress: Optional[Dict[str, Any]] = None
+        robot.events.subscribe(self.on_event, self.watchers)
+
+    def detach(self):
+        """Stop listening to the robot"""
+        self.robot.events.unsubscribe(self.on_event)
+
+    def on_event(self, event: Event):
+        self.stale.update(self.watchers[event.kind])
+
+    def refresh(self):
+        """Re-check stale objectives; the snapshot is rebuilt only if a result changed"""
+        self.stale.update(self.volatile)
+        if not self.stale:
+            return
+        changed = False
+        for index in self.stale:
+            objective = self.level.objectives[index]
+            completed = objective.check_completion(self.robot)
+            objective.completed = completed
+            if completed != self.results[index]:
+                self.results[index] = completed
+                changed = True
+        self.stale.clear()
+        if changed:
+            self._progress = None
+
+    @property
+    def progress(self) -> Dict[str, Any]:
+        """Same structure as BaseLevel.get_progress()"""
+        self.refresh()
+        if self._progress is None:
+            self._progress = {
+                'total_objectives': len(self.results),
+                'completed_objectives': sum(self.results),
+                'objectives_status': [
+                    {'description': obj.description, 'completed': done, 'type': obj.type}
+                    for obj, done in zip(self.level.objectives, self.results)
+                ]
+            }
+        return self._progress
+
+    def is_completed(self) -> bool:
+        self.refresh()
+        return all(self.results)
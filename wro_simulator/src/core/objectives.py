@@ -0,0 +1,124 @@
+"""
+Objective types for WRO Robot Control System
+Registry of objective classes, each compiled into a predicate when the level adds it
+"""
+
+from typing import Callable, Dict, Type
+from .events import *
+from .geometry import pixel_to_grid
+
+OBJECTIVE_TYPES: Dict[str, Type['Objective']] = {}
+
+
+def register_objective(obj_type: str):
+    """Class decorator adding an objective type to the registry"""
+    def register(cls):
+        OBJECTIVE_TYPES[obj_type] = cls
+        return cls
+    return register
+
+
+def create_objective(obj_type: str, description: str, **kwargs) -> 'Objective':
+    """Instantiate the registered class for obj_type (unknown types never complete)"""
+    return OBJECTIVE_TYPES.get(obj_type, Objective)(obj_type, description, **kwargs)
+
+
+class Objective:
+    """Represents a level objective.
+
+    Subclasses read their parameters once in compile() and return the
+    predicate that becomes check_completion. watches lists the robot event
+    kinds after which the result may change (see ObjectiveTracker); volatile
+    objectives can change without any event and are re-checked every time.
+    """
+
+    watches = ALL_KINDS
+    volatile = False
+
+    def __init__(self, obj_type: str, description: str, **kwargs):
+        self.type = obj_type
+        self.description = description
+        self.params = kwargs
+        self.completed = False
+        self.check_completion: Callable[..., bool] = self.compile()
+
+    def compile(self) -> Callable[..., bool]:
+        """Build the completion predicate (robot -> bool)"""
+        return lambda robot: False
+
+
+@register_objective('reach_target')
+class ReachTarget(Objective):
+    watches = (ARRIVED, HISTORY, LEVEL)
+
+    def compile(self):
+        target_x, target_y = self.params.get('target', (10, 10))
+        tolerance = self.params.get('tolerance', 1.0)
+        tolerance_sq = tolerance * tolerance
+
+        def check(robot):
+            grid_x, grid_y = pixel_to_grid(robot.x, robot.y)
+            return (grid_x - target_x) ** 2 + (grid_y - target_y) ** 2 <= tolerance_sq
+        return check
+
+
+@register_objective('collect_items')
+class CollectItems(Objective):
+    watches = (COLLECT, HISTORY, LEVEL)
+
+    def compile(self):
+        required = self.params.get('count', 1)
+        return lambda robot: robot.items_collected >= required
+
+
+@register_objective('avoid_obstacles')
+class AvoidObstacles(Objective):
+    watches = (COLLISION, HISTORY, LEVEL)
+
+    def compile(self):
+        max_collisions = self.params.get('max_collisions', 0)
+        return lambda robot: len(robot.collisions) <= max_collisions
+
+
+@register_objective('use_sensors')
+class UseSensors(Objective):
+    watches = (SENSOR, LEVEL)
+
+    def compile(self):
+        required = self.params.get('min_sensor_calls', self.params.get('sensor_calls', 1))
+        return lambda robot: robot.sensor_calls >= required
+
+
+@register_objective('efficient_path')
+class EfficientPath(Objective):
+    """At most max_commands commands ('executed', or 'raw' before optimizing)"""
+
+    watches = (MOVE, TURN, MESSAGE, HISTORY, LEVEL)
+
+    def compile(self):
+        max_commands = self.params.get('max_commands', 10)
+        count = self.params.get('count', 'executed')
+        return lambda robot: robot.command_count(count) <= max_commands
+
+
+@register_objective('optimize_path')
+@register_objective('efficiency_bonus')
+class FewerCommands(EfficientPath):
+    """Fewer than max_commands commands ("under 25", "fewer than 30")"""
+
+    def compile(self):
+        max_commands = self.params.get('max_commands', 10)
+        count = self.params.get('count', 'executed')
+        return lambda robot: robot.command_count(count) < max_commands
+
+
+@register_objective('time_challenge')
+class TimeChallenge(Objective):
+    """Under time_limit seconds of simulated time (which advances every tick)"""
+
+    watches = (ARRIVED, HISTORY, LEVEL)
+    volatile = True
+
+    def compile(self):
+        time_limit = self.params.get('time_limit', 60)
+        return lambda robot: robot.sim_time < time_limit
@@ -0,0 +1,112 @@
+"""
+Occupancy bitmap for WRO Robot Control System
+Bit-packed grid of the arena marking which cells touch an obstacle, for O(1) point queries
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+import numpy as np
+from .constants import *
+from .spatial_index import ObstacleGrid
+
+
+class OccupancyGrid:
+    """Two bit planes over the arena, one bit per cell, rows packed 8 cells per byte.
+
+    occupied: the cell touches an obstacle (edges included)
+    interior: the cell lies entirely inside an obstacle
+
+    A clear occupied bit or a set interior bit answers a point query on its
+    own; only cells on an obstacle's edge fall back to the exact test.
+    Everything outside the arena counts as blocked.
+    """
+
+    def __init__(self, cell_size: float = OCCUPANCY_CELL,
+                 index: Optional[ObstacleGrid] = None):
+        self.cell_size = cell_size
+        self.left, self.top = ARENA_LEFT, ARENA_TOP
+        self.right, self.bottom = ARENA_RIGHT, ARENA_BOTTOM
+        self.cols = math.ceil((self.right - self.left) / cell_size)
+        self.rows = math.ceil((self.bottom - self.top) / cell_size)
+        self.stride = (self.cols + 7) // 8  # bytes per row
+        self.occupied = bytearray(self.rows * self.stride)
+        self.interior = bytearray(self.rows * self.stride)
+        self.index = index if index is not None else ObstacleGrid()
+        self.obstacle_count = 0
+
+    @classmethod
+    def from_obstacles(cls, obstacles: Iterable[Dict], index: Optional[ObstacleGrid] = None,
+                       cell_size: float = OCCUPANCY_CELL) -> 'OccupancyGrid':
+        """Rasterise obstacle dicts (index is reused for exact edge tests)"""
+        obstacles = list(obstacles)
+        if index is None:
+            index = ObstacleGrid.from_obstacles(obstacles)
+        grid = cls(cell_size, index)
+
+        occupied = np.zeros((grid.rows, grid.cols), dtype=bool)
+        interior = np.zeros((grid.rows, grid.cols), dtype=bool)
+        size = cell_size
+        for o in obstacles:
+            x0 = (o['x'] - grid.left) / size
+            y0 = (o['y'] - grid.top) / size
+            x1 = (o['x'] + o['width'] - grid.left) / size
+            y1 = (o['y'] + o['height'] - grid.top) / size
+            # Cells touching the closed rectangle / cells fully inside it
+            occupied[max(0, math.floor(y0)):max(0, math.floor(y1) + 1),
+                     max(0, math.floor(x0)):max(0, math.floor(x1) + 1)] = True
+            interior[max(0, math.ceil(y0)):max(0, math.floor(y1)),
+                     max(0, math.ceil(x0)):max(0, math.floor(x1))] = True
+
+        grid.occupied[:] = np.packbits(occupied, axis=1).tobytes()
+        grid.interior[:] = np.packbits(interior, axis=1).tobytes()
+        grid.obstacle_count = len(obstacles)
+        return grid
+
+    def cell_of(self, x: float, y: float):
+        """(col, row) of the cell containing a point, or None outside the arena"""
+        if not (self.left <= x <= self.right and self.top <= y <= self.bottom):
+            return None
+        col = min(int((x - self.left) // self.cell_size), self.cols - 1)
+        row = min(int((y - self.top) // self.cell_size), self.rows - 1)
+        return col, row
+
+    def bit(self, plane: bytearray, col: int, row: int) -> bool:
+        return bool(plane[row * self.stride + (col >> 3)] & (0x80 >> (col & 7)))
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        """Whether a point is outside the arena or inside an obstacle (edges included)"""
+        cell = self.cell_of(x, y)
+        if cell is None:
+            return True
+        col, row = cell
+        if not self.bit(self.occupied, col, row):
+            return False
+        if self.bit(self.interior, col, row):
+            return True
+        return bool(self.index.query_point(x, y))
+
+    def rect_clear(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """True when no obstacle touches the box; False means "maybe", not "blocked"."""
+        if x0 < self.left or y0 < self.top or x1 > self.right or y1 > self.bottom:
+            return False
+        size = self.cell_size
+        c0 = int((x0 - self.left) // size)
+        c1 = min(int((x1 - self.left) // size), self.cols - 1)
+        r0 = int((y0 - self.top) // size)
+        r1 = min(int((y1 - self.top) // size), self.rows - 1)
+
+        b0, b1 = c0 >> 3, c1 >> 3
+        first_mask = 0xFF >> (c0 & 7)
+        last_mask = (0xFF << (7 - (c1 & 7))) & 0xFF
+        occupied = self.occupied
+        for row in range(r0, r1 + 1):
+            base = row * self.stride
+            if b0 == b1:
+                if occupied[base + b0] & first_mask & last_mask:
+                    return False
+                continue
+            if occupied[base + b0] & first_mask or occupied[base + b1] & last_mask:
+                return False
+            if any(occupied[base + b0 + 1:base + b1]):
+                return False
+        return True
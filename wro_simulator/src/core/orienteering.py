@@ -0,0 +1,121 @@
+"""
+Orienteering solver for WRO Robot Control System
+Most items collectable within a time limit, counting both driving and turning time
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from .constants import *
+from .routing import RouteOptimizer, Point
+
+
+def turn_time(from_heading: Optional[float], to_heading: Optional[float]) -> float:
+    """Seconds to turn between headings (degrees) the shorter way"""
+    if from_heading is None or to_heading is None:
+        return 0.0
+    return abs((to_heading - from_heading + 180) % 360 - 180) / ROTATION_SPEED
+
+
+class OrienteeringSolver:
+    """Branch-and-bound search for the best subset and order of stops.
+
+    Travel between two stops follows the shortest path and takes its length
+    at ANIMATION_SPEED plus ROTATION_SPEED turns at every corner, the same
+    timing PythonRobot.update() and settle() use. Only the turn on leaving
+    a stop depends on the route so far (the heading the robot arrived
+    with), so each leg is precomputed as (leaving heading, arriving
+    heading, fixed time).
+    """
+
+    def __init__(self, optimizer: RouteOptimizer, speed: float = ANIMATION_SPEED):
+        self.optimizer = optimizer
+        self.speed = speed
+        self.legs: Dict[Tuple[Point, Point], Optional[Tuple]] = {}
+
+    def leg(self, a: Point, b: Point) -> Optional[Tuple[Optional[float], Optional[float], float]]:
+        """(leaving heading, arriving heading, time excluding the first turn), None if unreachable"""
+        key = (a, b)
+        if key not in self.legs:
+            path = self.optimizer.path(a, b) if a != b else []
+            if path is None:
+                self.legs[key] = None
+            else:
+                time_taken = 0.0
+                headings = []
+                x, y = a
+                for wx, wy in path:
+                    if (wx, wy) == (x, y):
+                        continue
+                    heading = math.degrees(math.atan2(wy - y, wx - x))
+                    if headings:
+                        time_taken += turn_time(headings[-1], heading)
+                    headings.append(heading)
+                    time_taken += math.hypot(wx - x, wy - y) / self.speed
+                    x, y = wx, wy
+                self.legs[key] = (headings[0], headings[-1], time_taken) if headings else (None, None, 0.0)
+        return self.legs[key]
+
+    def travel_time(self, a: Point, b: Point, heading: Optional[float]) -> float:
+        """Seconds from a (facing heading) to b; inf when unreachable"""
+        leg = self.leg(a, b)
+        if leg is None:
+            return math.inf
+        return turn_time(heading, leg[0]) + leg[2]
+
+    def solve(self, start: Point, stops: Sequence[Point], time_limit: float,
+              end: Optional[Point] = None, values: Optional[Sequence[float]] = None,
+              heading: float = 0.0) -> Tuple[List[int], float, float]:
+        """Best (order, total value, predicted time) finishing at end within time_limit.
+
+        Ties in value go to the faster plan. Without an end the route may
+        stop at its last item.
+        """
+        n = len(stops)
+        values = list(values) if values is not None else [1.0] * n
+        points = [start] + list(stops) + ([end] if end is not None else [])
+        end_node = n + 1 if end is not None else None
+
+        legs = [[self.leg(a, b) for b in points] for a in points]
+        # Lower bound on any leg's time: it may start already facing the right way
+        fastest = [[leg[2] if leg is not None else math.inf for leg in row] for row in legs]
+
+        def leg_time(i, j, facing):
+            leg = legs[i][j]
+            return math.inf if leg is None else turn_time(facing, leg[0]) + leg[2]
+
+        def finish_time(node, facing):
+            return 0.0 if end_node is None else leg_time(node, end_node, facing)
+
+        best = {'order': [], 'value': 0.0, 'time': finish_time(0, heading)}
+        if best['time'] > time_limit:
+            best['time'] = math.inf
+
+        def search(node, facing, elapsed, value, order, remaining):
+            # Record the plan that stops here (and heads for the end)
+            total = elapsed + finish_time(node, facing)
+            if total <= time_limit and (value > best['value'] or
+                                        (value == best['value'] and total < best['time'])):
+                best.update(order=list(order), value=value, time=total)
+
+            # Bound: every item still reachable on its own, added for free
+            time_left = time_limit - elapsed
+            feasible = [j for j in remaining
+                        if fastest[node][j] + (fastest[j][end_node] if end_node is not None else 0) <= time_left]
+            bound = value + sum(values[j - 1] for j in feasible)
+            if bound < best['value'] or (bound == best['value'] and elapsed >= best['time']):
+                return
+
+            # Nearest first, so good plans are found early and prune more
+            for j in sorted(feasible, key=lambda j: fastest[node][j]):
+                step = leg_time(node, j, facing)
+                if elapsed + step > time_limit:
+                    continue
+                order.append(j - 1)
+                remaining.remove(j)
+                search(j, legs[node][j][1] if legs[node][j][1] is not None else facing,
+                       elapsed + step, value + values[j - 1], order, remaining)
+                remaining.add(j)
+                order.pop()
+
+        search(0, heading, 0.0, 0.0, [], set(range(1, n + 1)))
+        return best['order'], best['value'], best['time']
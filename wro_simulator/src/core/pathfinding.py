@@ -0,0 +1,182 @@
+"""
+Path planning for WRO Robot Control System
+A* over the arena grid inflated by the robot radius, with an LRU cache of cell paths
+"""
+
+import heapq
+import math
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+from .constants import *
+from .geometry import circle_path_clear
+from .spatial_index import ObstacleGrid
+from .distance_field import DistanceField
+
+SQRT2 = math.sqrt(2)
+
+# 8-connected moves: (d_col, d_row, cost in cells)
+NEIGHBOURS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2)]
+
+
+def path_length(points: Sequence[Tuple[float, float]]) -> float:
+    """Total length of a polyline"""
+    return sum(math.hypot(x1 - x0, y1 - y0) for (x0, y0), (x1, y1) in zip(points, points[1:]))
+
+
+class PathPlanner:
+    """Shortest collision-free routes for a circular robot on one level.
+
+    A cell is free when the robot fits at its centre (distance field value at
+    least the radius). A* finds an 8-connected cell path, which is then
+    shortened to the few waypoints that can see each other. Cell paths are
+    cached by (start cell, goal cell) with least-recently-used eviction and
+    smoothed per query, since the exact endpoints differ within a cell.
+    """
+
+    def __init__(self, distance_field: DistanceField, index: ObstacleGrid,
+                 radius: float = ROBOT_SIZE, cache_size: int = PATH_CACHE_SIZE):
+        self.index = index
+        self.radius = radius
+        self.cell_size = distance_field.cell_size
+        self.cols = distance_field.cols
+        self.rows = distance_field.rows
+        self.free = bytearray((distance_field.values >= radius).ravel().tobytes())
+        self.obstacle_count = distance_field.obstacle_count
+
+        self.cache: 'OrderedDict[Tuple[int, int], Optional[Tuple]]' = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def cell_of(self, x: float, y: float) -> Optional[int]:
+        """Flat index of the cell containing a point, or None outside the arena"""
+        col = int((x - ARENA_LEFT) // self.cell_size)
+        row = int((y - ARENA_TOP) // self.cell_size)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        return row * self.cols + col
+
+    def centre(self, cell: int) -> Tuple[float, float]:
+        row, col = divmod(cell, self.cols)
+        return (ARENA_LEFT + (col + 0.5) * self.cell_size,
+                ARENA_TOP + (row + 0.5) * self.cell_size)
+
+    def search(self, start: int, goal: int) -> Optional[List[int]]:
+        """A* from start to goal cell; the start cell itself may be blocked"""
+        cols, free = self.cols, self.free
+        goal_row, goal_col = divmod(goal, cols)
+
+        def heuristic(cell):
+            # Octile distance, exact on an empty 8-connected grid
+            row, col = divmod(cell, cols)
+            dx, dy = abs(col - goal_col), abs(row - goal_row)
+            return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+        g_cost = {start: 0.0}
+        came_from = {start: None}
+        open_heap = [(heuristic(start), 0.0, start)]
+        closed = set()
+
+        while open_heap:
+            _, g, cell = heapq.heappop(open_heap)
+            if cell == goal:
+                path = []
+                while cell is not None:
+                    path.append(cell)
+                    cell = came_from[cell]
+                return path[::-1]
+            if cell in closed:
+                continue
+            closed.add(cell)
+
+            row, col = divmod(cell, cols)
+            for d_col, d_row, cost in NEIGHBOURS:
+                n_col, n_row = col + d_col, row + d_row
+                if not (0 <= n_col < cols and 0 <= n_row < self.rows):
+                    continue
+                neighbour = n_row * cols + n_col
+                if not free[neighbour] or neighbour in closed:
+                    continue
+                # No cutting corners past a blocked cell
+                if d_col and d_row and not (free[row * cols + n_col] and free[n_row * cols + col]):
+                    continue
+                new_g = g + cost
+                if new_g < g_cost.get(neighbour, math.inf):
+                    g_cost[neighbour] = new_g
+                    came_from[neighbour] = cell
+                    heapq.heappush(open_heap, (new_g + heuristic(neighbour), new_g, neighbour))
+
+        return None
+
+    def segment_clear(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """Whether the robot can drive straight from (x0, y0) to (x1, y1)"""
+        return circle_path_clear(self.index, x0, y0, x1, y1, self.radius)
+
+    def smooth(self, points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """Drop waypoints the robot can drive past in a straight line"""
+        result = [points[0]]
+        anchor = 0
+        while anchor < len(points) - 1:
+            # Furthest point visible from the anchor (the next one always is)
+            reach = len(points) - 1
+            while reach > anchor + 1 and not self.segment_clear(*points[anchor], *points[reach]):
+                reach -= 1
+            result.append(points[reach])
+            anchor = reach
+        return result
+
+    def free_cell_near(self, x: float, y: float) -> Optional[int]:
+        """The point's own cell if free, else the closest free cell whose centre it can reach straight"""
+        cell = self.cell_of(x, y)
+        if cell is None or self.free[cell]:
+            return cell
+        row, col = divmod(cell, self.cols)
+        reach = math.ceil(self.radius / self.cell_size) + 1
+        candidates = []
+        for n_row in range(max(0, row - reach), min(self.rows, row + reach + 1)):
+            for n_col in range(max(0, col - reach), min(self.cols, col + reach + 1)):
+                neighbour = n_row * self.cols + n_col
+                if self.free[neighbour]:
+                    cx, cy = self.centre(neighbour)
+                    candidates.append(((cx - x) ** 2 + (cy - y) ** 2, neighbour))
+        for _, neighbour in sorted(candidates):
+            if self.segment_clear(*self.centre(neighbour), x, y):
+                return neighbour
+        return None
+
+    def plan(self, x0: float, y0: float, x1: float, y1: float) -> Optional[List[Tuple[float, float]]]:
+        """Waypoints (pixels) after the start and ending at the goal, or None if unreachable"""
+        if self.segment_clear(x0, y0, x1, y1):
+            return [(x1, y1)]
+
+        start = self.cell_of(x0, y0)
+        if start is None or not self.segment_clear(x1, y1, x1, y1):
+            return None
+        # The goal may be legal while its cell's centre is not: search to the
+        # nearest free cell the goal can see instead
+        goal = self.free_cell_near(x1, y1)
+        if goal is None:
+            return None
+
+        key = (start, goal)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            cells = self.cache[key]
+        else:
+            self.misses += 1
+            cells = self.search(start, goal)
+            cells = tuple(cells) if cells else None
+            self.cache[key] = cells
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+        if cells is None:
+            return None
+        # Smooth between the exact endpoints; the cell centres stay wherever
+        # the endpoints cannot see past them
+        route = self.smooth([(x0, y0)] + [self.centre(cell) for cell in cells] + [(x1, y1)])
+        if not all(self.segment_clear(*a, *b) for a, b in zip(route, route[1:])):
+            return None
+        return route[1:]
@@ -0,0 +1,141 @@
+"""
+Robot program optimizer for WRO Robot Control System
+Captures motion commands, coalesces them with a peephole pass, then runs them
+"""
+
+import math
+from typing import List, Tuple
+from .robot import PythonRobot
+from .events import MESSAGE
+from .constants import UNIT_SIZE
+
+Command = Tuple[str, float]
+
+MOTION_COMMANDS = ('forward', 'backward', 'left', 'right')
+
+
+def optimize_commands(commands: List[Command]) -> List[Command]:
+    """Peephole pass over motion commands.
+
+    Consecutive forward/backward moves are merged into one signed move,
+    consecutive left/right turns into one net turn normalised to
+    (-180, 180], and moves or turns that cancel out are dropped. Merged moves
+    assume nothing stops the robot part-way through: CommandRecorder never
+    merges across a move that would hit an obstacle or the arena wall.
+    """
+    merged: List[List] = []  # ['move', units forward] / ['turn', degrees right]
+    for name, value in commands:
+        if name in ('forward', 'backward'):
+            kind, amount = 'move', value if name == 'forward' else -value
+        else:
+            kind, amount = 'turn', value if name == 'right' else -value
+
+        if merged and merged[-1][0] == kind:
+            merged[-1][1] += amount
+        else:
+            merged.append([kind, amount])
+
+    optimized: List[Command] = []
+    for kind, amount in merged:
+        if kind == 'turn':
+            amount = -((-amount + 180) % 360 - 180)  # right turns in (-180, 180]
+            if abs(amount) < 1e-9:
+                continue
+            optimized.append(('right', amount) if amount > 0 else ('left', -amount))
+        else:
+            if abs(amount) < 1e-9:
+                continue
+            optimized.append(('forward', amount) if amount > 0 else ('backward', -amount))
+
+    # Dropping a zero move can leave two turns side by side; merge again
+    if len(optimized) < len(merged) and len(optimized) > 1:
+        again = optimize_commands(optimized)
+        if len(again) < len(optimized):
+            return again
+    return optimized
+
+
+def path_to_commands(x: float, y: float, angle: float,
+                     waypoints: List[Tuple[float, float]]) -> List[Command]:
+    """Turn-and-drive commands that take a robot at (x, y, angle) through waypoints (pixels)"""
+    commands: List[Command] = []
+    for wx, wy in waypoints:
+        heading = math.degrees(math.atan2(wy - y, wx - x))
+        commands.append(('right', heading - angle))
+        commands.append(('forward', math.hypot(wx - x, wy - y) / UNIT_SIZE))
+        x, y, angle = wx, wy, heading
+    return optimize_commands(commands)
+
+
+class CommandRecorder:
+    """Stands in for the robot in a student script.
+
+    Motion commands are buffered; any other use of the robot (sensors,
+    collect, attributes) first flushes the buffer, so the script sees the
+    same state it would without the optimizer.
+    """
+
+    def __init__(self, robot: PythonRobot):
+        self.robot = robot
+        self.pending: List[Command] = []
+        self.raw_count = 0
+        self.optimized_count = 0
+
+    def forward(self, distance: float = 1):
+        self.pending.append(('forward', distance))
+
+    def backward(self, distance: float = 1):
+        self.pending.append(('backward', distance))
+
+    def left(self, angle: float = 90):
+        self.pending.append(('left', angle))
+
+    def right(self, angle: float = 90):
+        self.pending.append(('right', angle))
+
+    def merge_runs(self) -> List[List[Command]]:
+        """Buffered commands split around every move the robot would be stopped on.
+
+        A blocked move ends short of where the commands say, so merging it
+        with its neighbours (or cancelling it out) would change the result;
+        it is kept in a run of its own.
+        """
+        robot = self.robot
+        x, y, angle = robot.plan_x, robot.plan_y, robot.plan_angle
+        runs: List[List[Command]] = [[]]
+        for name, value in self.pending:
+            if name in ('left', 'right'):
+                angle += value if name == 'right' else -value
+                runs[-1].append((name, value))
+                continue
+
+            distance = (value if name == 'forward' else -value) * UNIT_SIZE
+            end_x = x + distance * math.cos(math.radians(angle))
+            end_y = y + distance * math.sin(math.radians(angle))
+            clamped = robot.clamp_to_arena(end_x, end_y)
+            stop_x, stop_y, obstacle = robot.move_stop(x, y, *clamped)
+            if obstacle is not None or clamped != (end_x, end_y):
+                runs += [[(name, value)], []]
+            else:
+                runs[-1].append((name, value))
+            x, y = stop_x, stop_y
+        return [run for run in runs if run]
+
+    def flush(self):
+        """Optimize and execute the buffered commands"""
+        if not self.pending:
+            return
+
+        optimized = [command for run in self.merge_runs() for command in optimize_commands(run)]
+        self.raw_count += len(self.pending)
+        self.optimized_count += len(optimized)
+        self.robot.commands_saved += len(self.pending) - len(optimized)
+        self.robot.events.emit(MESSAGE, ">> Optimizer: {} commands -> {}", len(self.pending), len(optimized))
+        self.pending = []
+
+        for name, value in optimized:
+            getattr(self.robot, name)(value)
+
+    def __getattr__(self, name):
+        self.flush()
+        return getattr(self.robot, name)
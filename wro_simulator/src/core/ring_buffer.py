@@ -0,0 +1,67 @@
+"""
+Ring buffer for WRO Robot Control System
+Fixed-capacity, array-backed storage for history and trail samples
+"""
+
+from array import array
+from typing import Tuple
+
+
+class RingBuffer:
+    """Circular buffer of fixed-width float records.
+
+    Records live in one flat array('d'); appending when full overwrites the
+    oldest record, so every operation is O(1) and nothing is shifted.
+    """
+
+    def __init__(self, capacity: int, width: int):
+        self.capacity = capacity
+        self.width = width
+        self.data = array('d', bytes(8 * capacity * width))
+        self.start = 0
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
+
+    def slot(self, index: int) -> int:
+        """Offset in self.data of the record at logical index (0 = oldest)"""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ring buffer index out of range")
+        return ((self.start + index) % self.capacity) * self.width
+
+    def append(self, *values: float):
+        """Add a record, dropping the oldest one when full"""
+        if self.length < self.capacity:
+            base = ((self.start + self.length) % self.capacity) * self.width
+            self.length += 1
+        else:
+            base = self.start * self.width
+            self.start = (self.start + 1) % self.capacity
+
+        data = self.data
+        for offset, value in enumerate(values):
+            data[base + offset] = value
+
+    def pop(self) -> Tuple[float, ...]:
+        """Remove and return the newest record"""
+        record = self[-1]
+        self.length -= 1
+        return record
+
+    def clear(self):
+        self.start = 0
+        self.length = 0
+
+    def __getitem__(self, index: int) -> Tuple[float, ...]:
+        base = self.slot(index)
+        return tuple(self.data[base:base + self.width])
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
@@ -4,8 +4,20 @@ Robot class for WRO Robot Control System
 
 import math
 import time
+from collections import deque
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 from .constants import *
+from .geometry import ray_bounds_distance, sweep_circle_rect, pixel_to_grid, grid_to_pixel
+from .spatial_index import ObstacleGrid, ItemHash
+from .occupancy import OccupancyGrid
+from .distance_field import DistanceField
+from .pathfinding import PathPlanner, path_length
+from .visibility import VisibilityGraph
+from .lidar import obstacle_array, cast_rays, beam_angles
+from .ring_buffer import RingBuffer
+from .noise import NoiseModel
+from .events import *
 
 
 class PythonRobot:
@@ -23,7 +35,9 @@ class PythonRobot:
         self.score = 0
         self.items_collected = 0
         self.commands_executed = 0
+        self.commands_saved = 0  # raw commands merged away by the optimizer
         self.sensor_calls = 0
+        self.collisions: List[Dict] = []  # one event per blocked move
         self.start_time: Optional[float] = None
         self.level_start_time: Optional[float] = None
         
@@ -33,46 +47,301 @@ class PythonRobot:
         self.target_angle = 0
         self.animating = False
         self.animation_speed = ANIMATION_SPEED
+
+        # Motion program: commands wait here until the previous one finishes.
+        # The plan pose is where the robot will be once the queue is drained.
+        self.command_queue = deque()
+        self.plan_x = x
+        self.plan_y = y
+        self.plan_angle = 0
+
+        # Sensor and motor noise (off unless configured with set_noise)
+        self.noise = NoiseModel()
+
+        # Headless mode: resolve motion as soon as a command is issued
+        self.instant_motion = False
+        self.settle_dt: Optional[float] = None  # None = jump, else fixed tick
+        self.sim_time = 0.0  # simulated seconds since level start
+
+        # Pose before the last simulation step, for interpolated drawing
+        self.prev_x = x
+        self.prev_y = y
+        self.prev_angle = 0
         
-        # History for undo functionality
-        self.position_history: List[Tuple[float, float, float]] = [(x, y, 0)]
+        # History for undo/redo: one (x, y, angle, score, items_collected)
+        # record per command, plus the items taken by collect() in order
+        self.history = RingBuffer(MAX_HISTORY, 5)
+        self.redo_history = RingBuffer(MAX_HISTORY, 5)
+        self.collected_log: List[List] = []  # [item_key, item] pairs
+        self.start_state = (x, y, 0, 0, 0)
         
         # Environment
-        self.obstacles: List[Dict] = []
-        self.items: List[Dict] = []
+        self.level = None  # set by reset_for_level(); lends its route planners
+        self.tracker = None  # objective tracker following this robot, set by Level.track()
+        self.obstacles: List[Dict] = []  # also builds self.obstacle_index
+        self.items: List[Dict] = []  # stored in self.item_index
 
         # Callback for objective checking
         self.objective_check_callback = None
 
+        # Structured log of everything the robot does (the console subscribes)
+        self.events = EventBus()
+
         # Visual effects
-        self.trail_positions = []
         self.max_trail_length = 10
+        self.trail_positions = RingBuffer(self.max_trail_length, 2)
     
+    @property
+    def obstacles(self) -> List[Dict]:
+        """Obstacles in the current environment"""
+        return self._obstacles
+
+    @obstacles.setter
+    def obstacles(self, obstacles: List[Dict]):
+        self.set_obstacles(obstacles)
+
+    def set_obstacles(self, obstacles: List[Dict], index: Optional[ObstacleGrid] = None,
+                      occupancy: Optional[OccupancyGrid] = None,
+                      distance_field: Optional[DistanceField] = None):
+        """Replace the environment obstacles, reusing prebuilt level structures if given"""
+        self._obstacles = obstacles
+        self.obstacle_index = index if index is not None else ObstacleGrid.from_obstacles(obstacles)
+        # Built lazily when not shared by the level
+        self._occupancy = occupancy
+        self._distance_field = distance_field
+        # Route planners, taken from the level (or built) on first use
+        self._path_planner = None
+        self._visibility_graph = None
+        self._obstacle_array = None  # packed lazily for scan()
+
+    @property
+    def occupancy(self) -> OccupancyGrid:
+        """Occupancy bitmap of the current obstacles"""
+        if self._occupancy is None or self._occupancy.obstacle_count != len(self._obstacles):
+            self._occupancy = OccupancyGrid.from_obstacles(self._obstacles, self.obstacle_index)
+        return self._occupancy
+
+    @property
+    def distance_field(self) -> DistanceField:
+        """Distance field of the current obstacles and arena walls"""
+        if self._distance_field is None or self._distance_field.obstacle_count != len(self._obstacles):
+            self._distance_field = DistanceField.from_obstacles(self._obstacles)
+        return self._distance_field
+
+    @property
+    def path_planner(self) -> PathPlanner:
+        """Route planner for the current obstacles (the level's, sharing its route cache)"""
+        if self._path_planner is None or self._path_planner.obstacle_count != len(self._obstacles):
+            if self.uses_level_obstacles():
+                self._path_planner = self.level.path_planner
+            else:
+                self._path_planner = PathPlanner(self.distance_field, self.obstacle_index, self.size)
+        return self._path_planner
+
+    @property
+    def visibility_graph(self) -> VisibilityGraph:
+        """Route graph over obstacle corners for the current obstacles (the level's if shared)"""
+        if self._visibility_graph is None or self._visibility_graph.obstacle_count != len(self._obstacles):
+            if self.uses_level_obstacles():
+                self._visibility_graph = self.level.visibility_graph
+            else:
+                self._visibility_graph = VisibilityGraph(self._obstacles, self.obstacle_index, self.size)
+        return self._visibility_graph
+
+    def uses_level_obstacles(self) -> bool:
+        """Whether the robot still has its level's obstacles, so the level's planners apply"""
+        return (self.level is not None and self.size == ROBOT_SIZE and
+                self.obstacle_index is self.level.get_obstacle_index())
+
+    @property
+    def raw_commands(self) -> int:
+        """Commands as written by the student, before optimization"""
+        return self.commands_executed + self.commands_saved
+
+    def command_count(self, count: str = 'executed') -> int:
+        """Command total for scoring: 'executed' or 'raw'"""
+        return self.raw_commands if count == 'raw' else self.commands_executed
+
+    @property
+    def items(self) -> List[Dict]:
+        """Items still to be collected (a snapshot list)"""
+        return list(self.item_index)
+
+    @items.setter
+    def items(self, items: List[Dict]):
+        self.item_index = ItemHash.from_items(items)
+
     def forward(self, distance: float = 1) -> str:
         """Move robot forward by distance units"""
         self.commands_executed += 1
         pixel_distance = distance * UNIT_SIZE
-        print(f">> Moving forward {distance} units ({pixel_distance} pixels)...")
+        self.events.emit(MOVE, ">> Moving forward {} units ({} pixels)...", distance, pixel_distance,
+                         distance=distance)
 
-        angle_rad = math.radians(self.angle)
-        new_x = self.x + pixel_distance * math.cos(angle_rad)
-        new_y = self.y + pixel_distance * math.sin(angle_rad)
+        # Start from where earlier queued commands leave the robot; with
+        # noise the wheels slip and the heading drifts along the way
+        travelled, drift = self.noise.move(pixel_distance)
+        new_angle = (self.plan_angle + drift) % 360
+        angle_rad = math.radians(new_angle)
+        new_x = self.plan_x + travelled * math.cos(angle_rad)
+        new_y = self.plan_y + travelled * math.sin(angle_rad)
 
-        # Keep within bounds
-        new_x = max(self.size, min(GAME_WIDTH - self.size, new_x))
-        new_y = max(self.size, min(SCREEN_HEIGHT - self.size, new_y))
+        # Keep within arena bounds
+        new_x, new_y = self.clamp_to_arena(new_x, new_y)
 
-        # Save position for undo
-        self.position_history.append((self.x, self.y, self.angle))
-        if len(self.position_history) > MAX_HISTORY:
-            self.position_history.pop(0)
+        # Stop at the first obstacle the robot's body would touch
+        new_x, new_y = self.sweep_collision(self.plan_x, self.plan_y, new_x, new_y)
 
-        self.target_x = new_x
-        self.target_y = new_y
-        self.animating = True
+        # Save state for undo
+        self.record_history()
+
+        if drift:
+            self.queue_motion('move', new_x, new_y, new_angle)
+        else:
+            self.queue_motion('move', new_x, new_y)
 
         return f"Moved to ({new_x/UNIT_SIZE:.1f}, {new_y/UNIT_SIZE:.1f})"
     
+    def queue_motion(self, kind: str, *target: float):
+        """Add a 'move' (x, y[, angle]) or 'turn' (angle) segment to the motion program"""
+        self.command_queue.append((kind, *target))
+        if kind == 'move':
+            self.plan_x, self.plan_y = target[:2]
+            if len(target) > 2:
+                self.plan_angle = target[2]
+        else:
+            self.plan_angle = target[0]
+
+        if not self.animating:
+            self.start_next_motion()
+        if self.instant_motion:
+            self.settle(self.settle_dt)
+
+    def start_next_motion(self):
+        """Begin animating the next queued segment"""
+        kind, *target = self.command_queue.popleft()
+        if kind == 'move':
+            self.target_x, self.target_y = target[:2]
+            if len(target) > 2:
+                self.target_angle = target[2]
+        else:
+            self.target_angle = target[0]
+        self.animating = True
+
+    def snapshot(self) -> Tuple[float, float, float, int, int]:
+        """Current state as a history record (pose once queued motion ends)"""
+        return (self.plan_x, self.plan_y, self.plan_angle,
+                self.score, self.items_collected)
+
+    def record_history(self):
+        """Save the state before a command; a new command discards redo"""
+        self.history.append(*self.snapshot())
+        self.redo_history.clear()
+
+    def restore(self, state: Tuple):
+        """Jump to a history record, putting back or re-taking collected items"""
+        x, y, angle, score, items_collected = state
+        self.x = self.target_x = self.prev_x = self.plan_x = x
+        self.y = self.target_y = self.prev_y = self.plan_y = y
+        self.angle = self.target_angle = self.prev_angle = self.plan_angle = angle
+        self.command_queue.clear()
+        self.animating = False
+        self.trail_positions.clear()
+        self.score = int(score)
+
+        items_collected = int(items_collected)
+        for entry in self.collected_log[items_collected:self.items_collected]:
+            entry[0] = self.item_index.insert(entry[1])
+        for entry in self.collected_log[self.items_collected:items_collected]:
+            self.item_index.remove(entry[0])
+        self.items_collected = items_collected
+
+    def undo(self) -> str:
+        """Undo the last command"""
+        if not self.history:
+            self.events.emit(HISTORY, "ERROR: Nothing to undo", level=WARNING)
+            return "Nothing to undo"
+
+        self.redo_history.append(*self.snapshot())
+        self.restore(self.history.pop())
+        self.events.emit(HISTORY, ">> Undo: back to ({:.1f}, {:.1f}), {:.1f} degrees",
+                         self.x / UNIT_SIZE, self.y / UNIT_SIZE, self.angle, action='undo')
+        return "Undone"
+
+    def redo(self) -> str:
+        """Redo the last undone command"""
+        if not self.redo_history:
+            self.events.emit(HISTORY, "ERROR: Nothing to redo", level=WARNING)
+            return "Nothing to redo"
+
+        self.history.append(*self.snapshot())
+        self.restore(self.redo_history.pop())
+        self.events.emit(HISTORY, ">> Redo: at ({:.1f}, {:.1f}), {:.1f} degrees",
+                         self.x / UNIT_SIZE, self.y / UNIT_SIZE, self.angle, action='redo')
+        return "Redone"
+
+    def reset(self) -> str:
+        """Return to the level start (can be undone)"""
+        self.record_history()
+        self.restore(self.start_state)
+        self.events.emit(HISTORY, ">> Robot reset to start position", action='reset')
+        return "Robot reset"
+
+    def clamp_to_arena(self, x: float, y: float) -> Tuple[float, float]:
+        """Nearest point to (x, y) where the robot's body stays inside the arena"""
+        return (max(ARENA_LEFT + self.size, min(ARENA_RIGHT - self.size, x)),
+                max(ARENA_TOP + self.size, min(ARENA_BOTTOM - self.size, y)))
+
+    def move_stop(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[float, float, Optional[Dict]]:
+        """Where a move from (x0, y0) to (x1, y1) stops, and the obstacle hit (None if clear).
+
+        The swept body is tested only against obstacles near the path;
+        nothing is recorded, so this can also be used to look ahead.
+        """
+        dx = x1 - x0
+        dy = y1 - y0
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return x1, y1, None
+
+        # Broadphase: nothing to test when the swept bounding box is clear in
+        # the occupancy bitmap, else the obstacles overlapping it
+        box_x, box_y = min(x0, x1) - self.size, min(y0, y1) - self.size
+        box_w, box_h = abs(dx) + 2 * self.size, abs(dy) + 2 * self.size
+        if self.occupancy.rect_clear(box_x, box_y, box_x + box_w, box_y + box_h):
+            return x1, y1, None
+        candidates = self.obstacle_index.query_rect(box_x, box_y, box_w, box_h)
+
+        first_hit = None
+        hit_obstacle = None
+        for obstacle in candidates:
+            t = sweep_circle_rect(x0, y0, dx, dy, self.size, obstacle)
+            if t is not None and (first_hit is None or t < first_hit):
+                first_hit = t
+                hit_obstacle = obstacle
+
+        if first_hit is None:
+            return x1, y1, None
+
+        # Back off a hair so the robot rests just outside the obstacle
+        t = max(0.0, first_hit - COLLISION_MARGIN / length)
+        return x0 + dx * t, y0 + dy * t, hit_obstacle
+
+    def sweep_collision(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[float, float]:
+        """Where the robot stops when moving from (x0, y0) to (x1, y1).
+
+        Computed once per command; a contact is recorded in self.collisions.
+        """
+        stop_x, stop_y, hit_obstacle = self.move_stop(x0, y0, x1, y1)
+        if hit_obstacle is None:
+            return stop_x, stop_y
+
+        self.collisions.append({'x': stop_x, 'y': stop_y, 'obstacle': hit_obstacle})
+        self.events.emit(COLLISION, "ERROR: Collision! Stopped after {:.2f} units",
+                         math.hypot(stop_x - x0, stop_y - y0) / UNIT_SIZE,
+                         level=WARNING, x=stop_x, y=stop_y, obstacle=hit_obstacle)
+        return stop_x, stop_y
+
     def backward(self, distance: float = 1) -> str:
         """Move robot backward by distance units"""
         return self.forward(-distance)
@@ -80,143 +349,273 @@ class PythonRobot:
     def left(self, angle: float = 90) -> str:
         """Turn robot left by angle degrees"""
         self.commands_executed += 1
-        print(f">> Turning left {angle} degrees...")
+        self.events.emit(TURN, ">> Turning left {} degrees...", angle, angle=-angle)
 
-        self.position_history.append((self.x, self.y, self.angle))
-        if len(self.position_history) > MAX_HISTORY:
-            self.position_history.pop(0)
+        self.record_history()
 
-        self.target_angle = (self.angle - angle) % 360
-        self.animating = True
+        new_angle = (self.plan_angle - self.noise.turn(angle)) % 360
+        self.queue_motion('turn', new_angle)
 
-        return f"Turned to {self.target_angle:.1f} degrees"
+        return f"Turned to {new_angle:.1f} degrees"
     
     def right(self, angle: float = 90) -> str:
         """Turn robot right by angle degrees"""
         self.commands_executed += 1
-        print(f">> Turning right {angle} degrees...")
+        self.events.emit(TURN, ">> Turning right {} degrees...", angle, angle=angle)
 
-        self.position_history.append((self.x, self.y, self.angle))
-        if len(self.position_history) > MAX_HISTORY:
-            self.position_history.pop(0)
+        self.record_history()
 
-        self.target_angle = (self.angle + angle) % 360
-        self.animating = True
+        new_angle = (self.plan_angle + self.noise.turn(angle)) % 360
+        self.queue_motion('turn', new_angle)
 
-        return f"Turned to {self.target_angle:.1f} degrees"
+        return f"Turned to {new_angle:.1f} degrees"
     
     def sensor(self) -> Dict:
         """Get sensor readings"""
         self.sensor_calls += 1
         readings = {
-            'front': self.get_distance_to_obstacle(0),
-            'left': self.get_distance_to_obstacle(-90),
-            'right': self.get_distance_to_obstacle(90),
+            'front': self.noise.range(self.get_distance_to_obstacle(0)),
+            'left': self.noise.range(self.get_distance_to_obstacle(-90)),
+            'right': self.noise.range(self.get_distance_to_obstacle(90)),
             'position': (round(self.x / UNIT_SIZE, 1), round(self.y / UNIT_SIZE, 1)),
             'angle': round(self.angle, 1)
         }
-        print(f">> Sensor readings: {readings}")
+        self.events.emit(SENSOR, ">> Sensor readings: {}", readings, sensor='all')
         return readings
     
     def front_sensor(self) -> float:
         """Get front sensor reading only"""
         self.sensor_calls += 1
-        distance = self.get_distance_to_obstacle(0)
-        print(f">> Front sensor: {distance}")
+        distance = self.noise.range(self.get_distance_to_obstacle(0))
+        self.events.emit(SENSOR, ">> Front sensor: {}", distance, sensor='front')
         return distance
     
     def left_sensor(self) -> float:
         """Get left sensor reading only"""
         self.sensor_calls += 1
-        distance = self.get_distance_to_obstacle(-90)
-        print(f">> Left sensor: {distance}")
+        distance = self.noise.range(self.get_distance_to_obstacle(-90))
+        self.events.emit(SENSOR, ">> Left sensor: {}", distance, sensor='left')
         return distance
     
     def right_sensor(self) -> float:
         """Get right sensor reading only"""
         self.sensor_calls += 1
-        distance = self.get_distance_to_obstacle(90)
-        print(f">> Right sensor: {distance}")
+        distance = self.noise.range(self.get_distance_to_obstacle(90))
+        self.events.emit(SENSOR, ">> Right sensor: {}", distance, sensor='right')
         return distance
     
+    def scan(self, n_beams: int = 36, fov: float = 360):
+        """Lidar scan: distances (units) and beam angles (degrees from heading)"""
+        if not isinstance(n_beams, (int, np.integer)) or n_beams < 1:
+            self.events.emit(SENSOR, "ERROR: Scan needs at least 1 beam, got {!r}", n_beams,
+                             level=WARNING, sensor='scan')
+            return f"Invalid beam count {n_beams!r}"
+        self.sensor_calls += 1
+        if self._obstacle_array is None or len(self._obstacle_array) != len(self.obstacles):
+            self._obstacle_array = obstacle_array(self.obstacles)
+
+        angles = beam_angles(n_beams, fov)
+        distances = cast_rays(self.x, self.y, np.radians(self.angle + angles), self._obstacle_array)
+        distances = self.noise.ranges((distances / UNIT_SIZE).astype(np.float32))
+        self.events.emit(SENSOR, ">> Lidar scan: {} beams, closest {:.2f}", n_beams, distances.min(),
+                         sensor='scan')
+        return distances, angles.astype(np.float32)
+
     def collect(self) -> str:
         """Collect nearby items"""
-        collected = 0
-        items_to_remove = []
-        
-        for i, item in enumerate(self.items):
-            distance = math.sqrt((self.x - item['x'])**2 + (self.y - item['y'])**2)
-            if distance < 40:  # Collection radius
-                items_to_remove.append(i)
-                collected += 1
-                self.items_collected += 1
-                self.score += 10
-        
-        # Remove collected items (reverse order to maintain indices)
-        for i in reversed(items_to_remove):
-            self.items.pop(i)
+        nearby = self.item_index.query_radius(self.x, self.y, COLLECT_RADIUS)
+        if nearby:
+            self.record_history()
+        # Forget items an undo put back but no redo will take again
+        del self.collected_log[self.items_collected:]
+        for key, item in nearby:
+            self.item_index.remove(key)
+            self.collected_log.append([key, item])
+
+        collected = len(nearby)
+        self.items_collected += collected
+        self.score += 10 * collected
         
         if collected > 0:
-            print(f"OK: Collected {collected} items! Total: {self.items_collected}")
+            self.events.emit(COLLECT, "OK: Collected {} items! Total: {}", collected, self.items_collected,
+                             collected=collected)
             return f"Collected {collected} items"
         else:
-            print("ERROR: No items nearby to collect")
+            self.events.emit(COLLECT, "ERROR: No items nearby to collect", level=WARNING, collected=0)
             return "No items nearby"
+
+    def nearest_item(self) -> Optional[Tuple[float, float]]:
+        """Grid position of the closest remaining item, or None"""
+        nearest = self.item_index.nearest(self.x, self.y)
+        if nearest is None:
+            self.events.emit(SENSOR, ">> No items left", sensor='item')
+            return None
+
+        _, item, distance = nearest
+        grid_x, grid_y = pixel_to_grid(item['x'], item['y'])
+        position = (round(grid_x, 1), round(grid_y, 1))
+        self.events.emit(SENSOR, ">> Nearest item: {}, {:.1f} units away", position, distance / UNIT_SIZE,
+                         sensor='item')
+        return position
     
     def get_distance_to_obstacle(self, angle_offset: float) -> float:
         """Get distance to nearest obstacle in given direction"""
         sensor_angle = math.radians(self.angle + angle_offset)
-        sensor_range = 200  # pixels
-        
-        # Cast ray to find obstacles
-        for distance in range(1, sensor_range, 5):
-            check_x = self.x + distance * math.cos(sensor_angle)
-            check_y = self.y + distance * math.sin(sensor_angle)
-            
-            # Check bounds
-            if check_x <= 0 or check_x >= GAME_WIDTH or check_y <= 0 or check_y >= SCREEN_HEIGHT:
-                return distance / UNIT_SIZE
-            
-            # Check obstacles
-            for obstacle in self.obstacles:
-                if (obstacle['x'] <= check_x <= obstacle['x'] + obstacle['width'] and
-                    obstacle['y'] <= check_y <= obstacle['y'] + obstacle['height']):
-                    return distance / UNIT_SIZE
-        
-        return sensor_range / UNIT_SIZE
+        dx = math.cos(sensor_angle)
+        dy = math.sin(sensor_angle)
+
+        # A sensor pressed into an obstacle reads zero
+        if self.occupancy.is_blocked(self.x, self.y):
+            return 0.0
+
+        # Skip the open space in a few distance-field steps, then finish with
+        # exact distances to the arena wall and the closest obstacle
+        travelled = self.distance_field.sphere_trace(self.x, self.y, dx, dy, SENSOR_RANGE)
+        if travelled >= SENSOR_RANGE:
+            return SENSOR_RANGE / UNIT_SIZE
+        x = self.x + dx * travelled
+        y = self.y + dy * travelled
+
+        distance = ray_bounds_distance(x, y, dx, dy, ARENA_LEFT, ARENA_TOP, ARENA_RIGHT, ARENA_BOTTOM)
+        distance = min(distance, SENSOR_RANGE - travelled)
+
+        hit, _ = self.obstacle_index.raycast(x, y, dx, dy, distance)
+        if hit is not None:
+            distance = hit
+
+        return (travelled + distance) / UNIT_SIZE
+
+    def clearance(self) -> float:
+        """Gap (units) between the robot body and the nearest obstacle or wall.
+
+        A single distance-field lookup, accurate to within a few pixels.
+        """
+        gap = self.distance_field.sample(self.x, self.y) - self.size
+        return max(0.0, gap) / UNIT_SIZE
+
+    def set_noise(self, range_sigma: float = 0.0, heading_sigma: float = 0.0,
+                  slip: float = 0.0, seed: Optional[int] = None) -> int:
+        """Turn on sensor/motor noise (all zero turns it off); returns the seed to replay with"""
+        self.noise = NoiseModel(range_sigma, heading_sigma, slip, seed)
+        self.events.emit(MESSAGE, ">> Noise: range {}, heading {}, slip {} (seed {})",
+                         range_sigma, heading_sigma, slip, self.noise.seed)
+        return self.noise.seed
+
+    def plan_path(self, x: float, y: float, method: str = 'grid') -> Optional[List[Tuple[float, float]]]:
+        """Shortest collision-free waypoints (grid units) from the robot to (x, y).
+
+        method='grid' searches the A* grid; method='visibility' returns a
+        near-optimal any-angle route turning only at square-inflated corners.
+        """
+        goal_x, goal_y = grid_to_pixel(x, y)
+        if method == 'visibility':
+            route = self.visibility_graph.shortest_path(self.plan_x, self.plan_y, goal_x, goal_y)
+        else:
+            route = self.path_planner.plan(self.plan_x, self.plan_y, goal_x, goal_y)
+        if route is None:
+            self.events.emit(MESSAGE, "ERROR: No path to ({}, {})", x, y, level=WARNING)
+            return None
+
+        # Exact coordinates: rounding could move a corner into an obstacle
+        waypoints = [pixel_to_grid(px, py) for px, py in route]
+        length = path_length([(self.plan_x, self.plan_y)] + route) / UNIT_SIZE
+        self.events.emit(MESSAGE, ">> Path to ({}, {}): {} waypoints, {:.1f} units",
+                         x, y, len(waypoints), length, waypoints=waypoints)
+        return waypoints
     
     def reset_for_level(self, level):
         """Reset robot for a specific level"""
         # Position robot in game area (offset by sidebar)
-        start_x = SIDEBAR_WIDTH + 100  # 100 pixels from left edge of game area
-        start_y = 100  # 100 pixels from top
+        start_x = ROBOT_START_X  # 100 pixels from left edge of game area
+        start_y = ROBOT_START_Y  # 100 pixels from top
 
-        self.x = self.target_x = start_x
-        self.y = self.target_y = start_y
-        self.angle = self.target_angle = 0
-        self.position_history = [(start_x, start_y, 0)]
+        self.x = self.target_x = self.prev_x = self.plan_x = start_x
+        self.y = self.target_y = self.prev_y = self.plan_y = start_y
+        self.angle = self.target_angle = self.prev_angle = self.plan_angle = 0
+        self.noise = self.noise.replay()  # every attempt sees the same noise
+        self.command_queue.clear()
+        self.history.clear()
+        self.redo_history.clear()
+        self.collected_log = []
+        self.start_state = (start_x, start_y, 0, 0, 0)
         self.animating = False
+        self.sim_time = 0.0
         
         # Reset game metrics
         self.score = 0
         self.items_collected = 0
         self.commands_executed = 0
+        self.commands_saved = 0
         self.sensor_calls = 0
+        self.collisions = []
         self.level_start_time = time.time()
+        # The level's route cache and graph are shared, but only built once
+        # plan_path() needs them
+        self.level = level
+        self._path_planner = None
+        self._visibility_graph = None
         
-        print(f"🎯 Starting Level {level.level_id}: {level.name}")
-        print(f"📝 Objective: {level.description}")
+        self.events.emit(LEVEL, "🎯 Starting Level {}: {}", level.level_id, level.name, level_id=level.level_id)
+        self.events.emit(LEVEL, "📝 Objective: {}", level.description)
         
         # Show hints for difficulty 1-2 levels
         if level.difficulty <= 2 and level.hints:
-            print("💡 Hints:")
+            self.events.emit(LEVEL, "💡 Hints:")
             for hint in level.hints[:2]:
-                print(f"   • {hint}")
+                self.events.emit(LEVEL, "   • {}", hint)
         
         return f"Level {level.level_id} started"
     
+    def settle(self, dt: Optional[float] = None):
+        """Run the queued motion program to the end without rendered frames.
+
+        With dt=None the robot jumps from target to target and the simulated
+        clock advances by the time each animation would have taken; otherwise
+        the motion is stepped through update() in fixed ticks of dt seconds.
+        """
+        if dt is not None:
+            while self.animating:
+                self.update(dt)
+            return
+
+        while self.animating:
+            distance = math.hypot(self.target_x - self.x, self.target_y - self.y)
+            angle_diff = abs((self.target_angle - self.angle + 180) % 360 - 180)
+            self.sim_time += max(distance / self.animation_speed, angle_diff / ROTATION_SPEED)
+
+            self.x = self.prev_x = self.target_x
+            self.y = self.prev_y = self.target_y
+            self.angle = self.prev_angle = self.target_angle
+            self.finish_motion()
+
+    def finish_motion(self):
+        """End the current segment, notify the objective checker, start the next"""
+        self.animating = False
+        self.events.emit(ARRIVED, ">> Arrived at ({:.1f}, {:.1f}), {:.1f} degrees",
+                         self.x / UNIT_SIZE, self.y / UNIT_SIZE, self.angle, level=DEBUG)
+        # Clear trail when movement stops
+        self.trail_positions.clear()
+        # Auto-check objectives after every completed command
+        if self.objective_check_callback:
+            self.objective_check_callback()
+        if self.command_queue:
+            self.start_next_motion()
+
+    def render_pose(self, alpha: float = 1.0) -> Tuple[float, float, float]:
+        """Pose blended between the last two simulation steps"""
+        angle_diff = (self.angle - self.prev_angle + 180) % 360 - 180
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+            self.prev_angle + angle_diff * alpha
+        )
+
     def update(self, dt: float):
         """Update robot animation"""
+        self.sim_time += dt
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_angle = self.angle
         if not self.animating:
             return
         
@@ -245,7 +644,7 @@ class PythonRobot:
             angle_diff += 360
         
         if abs(angle_diff) > 1:
-            rotation_speed = 180 * dt  # degrees per second
+            rotation_speed = ROTATION_SPEED * dt
             if abs(angle_diff) <= rotation_speed:
                 self.angle = self.target_angle
             else:
@@ -255,15 +654,8 @@ class PythonRobot:
         
         # Update trail positions during movement
         if self.animating:
-            self.trail_positions.append((self.x, self.y))
-            if len(self.trail_positions) > self.max_trail_length:
-                self.trail_positions.pop(0)
+            self.trail_positions.append(self.x, self.y)
 
         # Check if animation is complete
         if distance <= 1 and abs(angle_diff) <= 1:
-            self.animating = False
-            # Clear trail when movement stops
-            self.trail_positions = []
-            # Auto-check objectives when movement is complete
-            if self.objective_check_callback:
-                self.objective_check_callback()
+            self.finish_motion()
@@ -0,0 +1,173 @@
+"""
+Route optimizer for WRO Robot Control System
+Best order to visit many items: exact Held-Karp for a few, 2-opt/Or-opt for many
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from .constants import *
+from .visibility import VisibilityGraph
+
+Point = Tuple[float, float]
+
+
+class RouteOptimizer:
+    """Orders stops by obstacle-aware travel distance.
+
+    Distances are shortest visibility-graph paths, memoized per point pair,
+    so repeated runs on the same level only pay for new points.
+    """
+
+    def __init__(self, graph: VisibilityGraph):
+        self.graph = graph
+        self.paths: Dict[Tuple[Point, Point], Optional[List[Point]]] = {}
+
+    def path(self, a: Point, b: Point) -> Optional[List[Point]]:
+        """Shortest path from a to b (waypoints after a), memoized"""
+        key = (a, b)
+        if key not in self.paths:
+            self.paths[key] = self.graph.shortest_path(a[0], a[1], b[0], b[1])
+        return self.paths[key]
+
+    def distance(self, a: Point, b: Point) -> float:
+        """Length of the shortest path in pixels (inf when unreachable)"""
+        if a == b:
+            return 0.0
+        path = self.path(a, b)
+        if path is None:
+            return math.inf
+        length = 0.0
+        x, y = a
+        for wx, wy in path:
+            length += math.hypot(wx - x, wy - y)
+            x, y = wx, wy
+        return length
+
+    def matrix(self, points: Sequence[Point]) -> List[List[float]]:
+        return [[self.distance(a, b) for b in points] for a in points]
+
+    def solve(self, start: Point, stops: Sequence[Point],
+              end: Optional[Point] = None) -> Tuple[List[int], float]:
+        """Visiting order (indices into stops) and route length in pixels.
+
+        The route starts at start and, if given, finishes at end. Stops the
+        robot cannot reach are left out of the order.
+        """
+        reachable = [i for i, stop in enumerate(stops) if self.distance(start, stop) < math.inf]
+        points = [start] + [stops[i] for i in reachable] + ([end] if end is not None else [])
+        dist = self.matrix(points)
+        n = len(reachable)
+        end_node = n + 1 if end is not None else None
+
+        if n <= ROUTE_EXACT_LIMIT:
+            order = held_karp(dist, n, end_node)
+        else:
+            order = nearest_neighbour(dist, n)
+            order = improve(dist, order, end_node)
+
+        return [reachable[i - 1] for i in order], tour_length(dist, order, end_node)
+
+    def waypoints(self, start: Point, stops: Sequence[Point], order: Sequence[int],
+                  end: Optional[Point] = None) -> List[Point]:
+        """Full polyline (after start) through the stops in order"""
+        points = [start] + [stops[i] for i in order] + ([end] if end is not None else [])
+        route: List[Point] = []
+        for a, b in zip(points, points[1:]):
+            if a != b:
+                route.extend(self.path(a, b) or [b])
+        return route
+
+
+def tour_length(dist: List[List[float]], order: Sequence[int], end: Optional[int]) -> float:
+    """Length of start(0) -> order -> end"""
+    nodes = [0] + list(order) + ([end] if end is not None else [])
+    return sum(dist[a][b] for a, b in zip(nodes, nodes[1:]))
+
+
+def held_karp(dist: List[List[float]], n: int, end: Optional[int]) -> List[int]:
+    """Exact shortest order of nodes 1..n from node 0 (dynamic programming over subsets)"""
+    if n == 0:
+        return []
+    full = (1 << n) - 1
+    # cost[mask][j]: shortest path from 0 through the set mask, ending at node j + 1
+    cost = [[math.inf] * n for _ in range(full + 1)]
+    parent = [[-1] * n for _ in range(full + 1)]
+    for j in range(n):
+        cost[1 << j][j] = dist[0][j + 1]
+
+    for mask in range(1, full + 1):
+        row = cost[mask]
+        for j in range(n):
+            here = row[j]
+            if here == math.inf or not mask & (1 << j):
+                continue
+            from_j = dist[j + 1]
+            for k in range(n):
+                if mask & (1 << k):
+                    continue
+                next_mask = mask | (1 << k)
+                candidate = here + from_j[k + 1]
+                if candidate < cost[next_mask][k]:
+                    cost[next_mask][k] = candidate
+                    parent[next_mask][k] = j
+
+    finish = [cost[full][j] + (dist[j + 1][end] if end is not None else 0) for j in range(n)]
+    last = min(range(n), key=finish.__getitem__)
+    order = []
+    mask = full
+    while last != -1:
+        order.append(last + 1)
+        mask, last = mask & ~(1 << last), parent[mask][last]
+    return order[::-1]
+
+
+def nearest_neighbour(dist: List[List[float]], n: int) -> List[int]:
+    """Greedy order: always go to the closest unvisited node"""
+    unvisited = set(range(1, n + 1))
+    order = []
+    current = 0
+    while unvisited:
+        current = min(unvisited, key=dist[current].__getitem__)
+        unvisited.remove(current)
+        order.append(current)
+    return order
+
+
+def improve(dist: List[List[float]], order: List[int], end: Optional[int]) -> List[int]:
+    """2-opt segment reversals and Or-opt segment moves until neither helps"""
+    best = list(order)
+    best_length = tour_length(dist, best, end)
+    while True:
+        improved = False
+
+        # 2-opt: reverse best[i:j]
+        for i in range(len(best) - 1):
+            for j in range(i + 2, len(best) + 1):
+                candidate = best[:i] + best[i:j][::-1] + best[j:]
+                length = tour_length(dist, candidate, end)
+                if length < best_length - 1e-9:
+                    best, best_length, improved = candidate, length, True
+
+        move = or_opt(dist, best, best_length, end)
+        if move is not None:
+            best, best_length = move
+        elif not improved:
+            return best
+
+
+def or_opt(dist: List[List[float]], order: List[int], length: float,
+           end: Optional[int]) -> Optional[Tuple[List[int], float]]:
+    """First move of a run of 1-3 stops (either way round) that shortens the route"""
+    for size in (1, 2, 3):
+        for i in range(len(order) - size + 1):
+            segment = order[i:i + size]
+            rest = order[:i] + order[i + size:]
+            for j in range(len(rest) + 1):
+                if j == i:
+                    continue
+                for piece in (segment, segment[::-1]):
+                    candidate = rest[:j] + piece + rest[j:]
+                    candidate_length = tour_length(dist, candidate, end)
+                    if candidate_length < length - 1e-9:
+                        return candidate, candidate_length
+    return None
@@ -0,0 +1,228 @@
+"""
+Spatial index for WRO Robot Control System
+Uniform grids over level obstacles (ray, point, rectangle queries) and items (radius queries)
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+from .constants import UNIT_SIZE, COLLECT_RADIUS
+from .geometry import ray_rect_distance
+
+
+class ObstacleGrid:
+    """Uniform grid of buckets holding the obstacle rectangles that overlap each cell"""
+
+    def __init__(self, cell_size: float = UNIT_SIZE * 2):
+        self.cell_size = cell_size
+        self.obstacles: List[Dict] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    @classmethod
+    def from_obstacles(cls, obstacles: Iterable[Dict], cell_size: float = UNIT_SIZE * 2) -> 'ObstacleGrid':
+        """Build an index over existing obstacle dicts"""
+        grid = cls(cell_size)
+        for obstacle in obstacles:
+            grid.insert(obstacle)
+        return grid
+
+    def __len__(self) -> int:
+        return len(self.obstacles)
+
+    def cell_range(self, x0: float, y0: float, x1: float, y1: float):
+        """Inclusive cell coordinates covering the box (x0, y0)-(x1, y1)"""
+        size = self.cell_size
+        return (math.floor(x0 / size), math.floor(y0 / size),
+                math.floor(x1 / size), math.floor(y1 / size))
+
+    def insert(self, obstacle: Dict):
+        """Add an obstacle to every cell it overlaps"""
+        index = len(self.obstacles)
+        self.obstacles.append(obstacle)
+
+        cx0, cy0, cx1, cy1 = self.cell_range(
+            obstacle['x'], obstacle['y'],
+            obstacle['x'] + obstacle['width'], obstacle['y'] + obstacle['height']
+        )
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), []).append(index)
+
+    def query_point(self, x: float, y: float) -> List[Dict]:
+        """Obstacles containing the point (edges included)"""
+        size = self.cell_size
+        bucket = self.cells.get((math.floor(x / size), math.floor(y / size)), ())
+        result = []
+        for index in bucket:
+            obstacle = self.obstacles[index]
+            if (obstacle['x'] <= x <= obstacle['x'] + obstacle['width'] and
+                    obstacle['y'] <= y <= obstacle['y'] + obstacle['height']):
+                result.append(obstacle)
+        return result
+
+    def query_rect(self, x: float, y: float, width: float, height: float) -> List[Dict]:
+        """Obstacles overlapping the rectangle (touching edges included)"""
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, x + width, y + height)
+        seen = set()
+        result = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for index in self.cells.get((cx, cy), ()):
+                    if index in seen:
+                        continue
+                    seen.add(index)
+                    obstacle = self.obstacles[index]
+                    if (obstacle['x'] <= x + width and x <= obstacle['x'] + obstacle['width'] and
+                            obstacle['y'] <= y + height and y <= obstacle['y'] + obstacle['height']):
+                        result.append(obstacle)
+        return result
+
+    def raycast(self, ox: float, oy: float, dx: float, dy: float,
+                max_distance: float) -> Tuple[Optional[float], Optional[Dict]]:
+        """Closest obstacle hit along a unit ray within max_distance.
+
+        Walks the grid cells the ray passes through (Amanatides & Woo) and
+        stops as soon as a hit is found before the current cell's exit.
+        """
+        size = self.cell_size
+        cx = math.floor(ox / size)
+        cy = math.floor(oy / size)
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+
+        # Ray distance to the next vertical / horizontal cell boundary
+        if dx != 0:
+            next_x = (cx + (1 if dx > 0 else 0)) * size
+            t_max_x = (next_x - ox) / dx
+            t_delta_x = size / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0:
+            next_y = (cy + (1 if dy > 0 else 0)) * size
+            t_max_y = (next_y - oy) / dy
+            t_delta_y = size / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        best_distance = None
+        best_obstacle = None
+        tested = set()
+        t_enter = 0.0
+
+        while t_enter <= max_distance:
+            for index in self.cells.get((cx, cy), ()):
+                if index in tested:
+                    continue
+                tested.add(index)
+                obstacle = self.obstacles[index]
+                hit = ray_rect_distance(ox, oy, dx, dy, obstacle)
+                if hit is not None and hit <= max_distance and (best_distance is None or hit < best_distance):
+                    best_distance = hit
+                    best_obstacle = obstacle
+
+            t_exit = min(t_max_x, t_max_y)
+            if best_distance is not None and best_distance <= t_exit:
+                break
+
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+            t_enter = t_exit
+
+        return best_distance, best_obstacle
+
+
+class ItemHash:
+    """Spatial hash of collectible items with O(1) expected radius queries and removal"""
+
+    def __init__(self, cell_size: float = COLLECT_RADIUS):
+        self.cell_size = cell_size
+        self.items: Dict[int, Dict] = {}  # key -> item, in insertion order
+        self.cells: Dict[Tuple[int, int], Dict[int, Dict]] = {}
+        self.next_key = 0
+        # Occupied cell extent, bounds the ring search in nearest()
+        self.min_cell = None
+        self.max_cell = None
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict], cell_size: float = COLLECT_RADIUS) -> 'ItemHash':
+        """Build a hash over existing item dicts"""
+        item_hash = cls(cell_size)
+        for item in items:
+            item_hash.insert(item)
+        return item_hash
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, item: Dict) -> int:
+        """Add an item and return its key"""
+        key = self.next_key
+        self.next_key += 1
+        self.items[key] = item
+
+        cell = self.cell_of(item['x'], item['y'])
+        self.cells.setdefault(cell, {})[key] = item
+        if self.min_cell is None:
+            self.min_cell = self.max_cell = cell
+        else:
+            self.min_cell = (min(self.min_cell[0], cell[0]), min(self.min_cell[1], cell[1]))
+            self.max_cell = (max(self.max_cell[0], cell[0]), max(self.max_cell[1], cell[1]))
+        return key
+
+    def remove(self, key: int):
+        """Remove an item by key"""
+        item = self.items.pop(key)
+        cell = self.cell_of(item['x'], item['y'])
+        bucket = self.cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[cell]
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[int, Dict]]:
+        """(key, item) pairs strictly closer than radius to (x, y)"""
+        cx0, cy0 = self.cell_of(x - radius, y - radius)
+        cx1, cy1 = self.cell_of(x + radius, y + radius)
+        radius_sq = radius * radius
+        result = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for key, item in self.cells.get((cx, cy), {}).items():
+                    if (item['x'] - x) ** 2 + (item['y'] - y) ** 2 < radius_sq:
+                        result.append((key, item))
+        return result
+
+    def nearest(self, x: float, y: float) -> Optional[Tuple[int, Dict, float]]:
+        """Closest (key, item, distance), searching outward ring by ring"""
+        if not self.items:
+            return None
+
+        cx, cy = self.cell_of(x, y)
+        max_ring = max(abs(cx - self.min_cell[0]), abs(cx - self.max_cell[0]),
+                       abs(cy - self.min_cell[1]), abs(cy - self.max_cell[1]))
+        best = None
+        best_distance = math.inf
+
+        for ring in range(max_ring + 1):
+            # Items in this ring or beyond are at least (ring - 1) cells away
+            if best is not None and best_distance <= (ring - 1) * self.cell_size:
+                break
+            for gx in range(cx - ring, cx + ring + 1):
+                for gy in range(cy - ring, cy + ring + 1):
+                    if max(abs(gx - cx), abs(gy - cy)) != ring:
+                        continue
+                    for key, item in self.cells.get((gx, gy), {}).items():
+                        distance = math.hypot(item['x'] - x, item['y'] - y)
+                        if distance < best_distance:
+                            best = (key, item)
+                            best_distance = distance
+
+        return best[0], best[1], best_distance
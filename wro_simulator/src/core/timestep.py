@@ -0,0 +1,40 @@
+"""
+Fixed timestep clock for WRO Robot Control System
+Decouples simulation steps from the render frame rate
+"""
+
+from typing import Callable
+from .constants import SIM_DT, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """Accumulates variable frame times and replays them as constant steps.
+
+    Every simulation step receives exactly the same dt, so trajectories do
+    not depend on how fast the machine renders. The returned alpha is how
+    far the leftover time reaches into the next step, for interpolated
+    drawing.
+    """
+
+    def __init__(self, step: float = SIM_DT, max_frame_time: float = MAX_FRAME_TIME):
+        self.step = step
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time: float, step_fn: Callable[[float], None],
+                scale: float = 1.0) -> float:
+        """Run as many fixed steps as frame_time covers; return the blend factor.
+
+        scale multiplies simulated time per real second (time warp): more
+        steps run per frame, each still exactly self.step long.
+        """
+        # Clamp long stalls (window drag, breakpoints) instead of spiralling
+        self.accumulator += min(frame_time, self.max_frame_time) * scale
+        while self.accumulator >= self.step:
+            step_fn(self.step)
+            self.accumulator -= self.step
+        return self.accumulator / self.step
+
+    def reset(self):
+        """Drop any partial step (e.g. when a level starts)"""
+        self.accumulator = 0.0
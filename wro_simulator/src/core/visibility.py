@@ -0,0 +1,131 @@
+"""
+Visibility graph for WRO Robot Control System
+Near-optimal any-angle paths around the obstacles, with square-inflated corners
+"""
+
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+from .constants import *
+from .geometry import circle_path_clear, circle_rect_overlap
+from .spatial_index import ObstacleGrid
+
+INFLATE_MARGIN = 0.5  # pixels kept between the robot and a corner it rounds
+
+
+class VisibilityGraph:
+    """Graph over the corners of every obstacle grown by the robot radius.
+
+    Two corners are linked when the robot can drive straight between them.
+    Boxes are grown square rather than along the robot's circle, so routes
+    are near-optimal rather than shortest: each corner costs a little extra
+    distance but is rounded with a single turn, which is what command counts
+    are graded on, and the route still stays at least the radius away from
+    every obstacle.
+    """
+
+    def __init__(self, obstacles: Iterable[Dict], index: Optional[ObstacleGrid] = None,
+                 radius: float = ROBOT_SIZE):
+        obstacles = list(obstacles)
+        self.index = index if index is not None else ObstacleGrid.from_obstacles(obstacles)
+        self.radius = radius
+        self.obstacle_count = len(obstacles)
+
+        offset = radius + INFLATE_MARGIN
+        self.vertices: List[Tuple[float, float]] = []
+        for o in obstacles:
+            for x in (o['x'] - offset, o['x'] + o['width'] + offset):
+                for y in (o['y'] - offset, o['y'] + o['height'] + offset):
+                    if self.is_free(x, y):
+                        self.vertices.append((x, y))
+
+        self.edges: Dict[int, List[Tuple[int, float]]] = {i: [] for i in range(len(self.vertices))}
+        for i, (x0, y0) in enumerate(self.vertices):
+            for j in range(i + 1, len(self.vertices)):
+                x1, y1 = self.vertices[j]
+                if self.segment_clear(x0, y0, x1, y1):
+                    cost = math.hypot(x1 - x0, y1 - y0)
+                    self.edges[i].append((j, cost))
+                    self.edges[j].append((i, cost))
+
+    def is_free(self, x: float, y: float, margin: float = 0) -> bool:
+        """Whether the robot (grown by margin) fits at a point"""
+        r = self.radius + margin
+        if not (ARENA_LEFT + r <= x <= ARENA_RIGHT - r and ARENA_TOP + r <= y <= ARENA_BOTTOM - r):
+            return False
+        return not any(circle_rect_overlap(x, y, r, o)
+                       for o in self.index.query_rect(x - r, y - r, 2 * r, 2 * r))
+
+    def nearest_free(self, x: float, y: float, reach: float) -> Optional[Tuple[float, float]]:
+        """A point within reach of (x, y) where the robot fits, preferring the closest.
+
+        The point keeps INFLATE_MARGIN of extra room, so the robot is not
+        left touching an obstacle it then cannot drive away from.
+        """
+        if self.is_free(x, y, INFLATE_MARGIN):
+            return x, y
+        step = OCCUPANCY_CELL
+        for ring in range(1, int(reach // step) + 1):
+            distance = ring * step
+            directions = max(8, int(2 * math.pi * distance / step))
+            for k in range(directions):
+                theta = 2 * math.pi * k / directions
+                px, py = x + distance * math.cos(theta), y + distance * math.sin(theta)
+                if self.is_free(px, py, INFLATE_MARGIN):
+                    return px, py
+        return None
+
+    def segment_clear(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        return circle_path_clear(self.index, x0, y0, x1, y1, self.radius)
+
+    def visible_from(self, x: float, y: float) -> List[Tuple[int, float]]:
+        """Graph vertices the robot can drive to straight from (x, y)"""
+        return [(i, math.hypot(vx - x, vy - y)) for i, (vx, vy) in enumerate(self.vertices)
+                if self.segment_clear(x, y, vx, vy)]
+
+    def shortest_path(self, x0: float, y0: float, x1: float, y1: float) -> Optional[List[Tuple[float, float]]]:
+        """Waypoints (pixels) after the start and ending at the goal, or None if unreachable"""
+        if self.segment_clear(x0, y0, x1, y1):
+            return [(x1, y1)]
+        if not self.is_free(x1, y1):
+            return None
+
+        # A* with the start and goal joined to the corners they can see
+        start, goal = len(self.vertices), len(self.vertices) + 1
+        goal_links = {i: cost for i, cost in self.visible_from(x1, y1)}
+        if not goal_links:
+            return None
+        points = self.vertices + [(x0, y0), (x1, y1)]
+
+        def neighbours(node):
+            links = self.visible_from(x0, y0) if node == start else self.edges[node]
+            for other, cost in links:
+                yield other, cost
+            if node in goal_links:
+                yield goal, goal_links[node]
+
+        g_cost = {start: 0.0}
+        came_from = {start: None}
+        open_heap = [(math.hypot(x1 - x0, y1 - y0), 0.0, start)]
+        closed = set()
+        while open_heap:
+            _, g, node = heapq.heappop(open_heap)
+            if node == goal:
+                path = []
+                while node != start:
+                    path.append(points[node])
+                    node = came_from[node]
+                return path[::-1]
+            if node in closed:
+                continue
+            closed.add(node)
+
+            for other, cost in neighbours(node):
+                new_g = g + cost
+                if other not in closed and new_g < g_cost.get(other, math.inf):
+                    g_cost[other] = new_g
+                    came_from[other] = node
+                    ox, oy = points[other]
+                    heapq.heappush(open_heap, (new_g + math.hypot(x1 - ox, y1 - oy), new_g, other))
+
+        return None
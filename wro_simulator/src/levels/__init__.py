@@ -22,4 +22,25 @@ Example:
             self.add_objective('reach_target', 'Reach (10, 10)', target=(10, 10))
             self.add_obstacle(100, 100, 50, 50)
             self.add_item(200, 200, 'coin')
+
+Levels can also be written without code as level_XX.json or level_XX.toml
+(see core/level_file.py). Positions are arena pixels, measured from the
+sidebar's edge:
+
+    # level_07.toml
+    level_id = 7
+    name = "My Data Level"
+    difficulty = 2
+    obstacles = [[100, 200, 50, 100]]
+    items = [[150, 100, "coin"]]
+    target_area = [450, 350, 100, 100]
+    hints = ["Collect the coin first"]
+
+    [[objectives]]
+    type = "reach_target"
+    description = "Reach (10, 8)"
+    target = [10, 8]
+
+The first load compiles the file into a binary .wrol cache next to it,
+which later loads are memory-mapped from.
 """
@@ -2,6 +2,7 @@
 Main application entry point for WRO Robot Control System
 """
 
+import math
 import pygame
 import sys
 import os
@@ -12,6 +13,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from .core.constants import *
 from .core.robot import PythonRobot
 from .core.level_manager import LevelManager
+from .core.timestep import FixedTimestep
+from .core.events import LEVEL, OBJECTIVE, MESSAGE, DEBUG, ERROR
 from .ui.level_select import LevelSelectScreen
 
 
@@ -33,6 +36,9 @@ class WROPythonControl:
         self.level_select_screen = LevelSelectScreen(self.level_manager)
         self.current_level = None
         self.level_start_time = None
+        self.completion_time = 0.0
+        self.timestep = FixedTimestep()
+        self.speed = 1  # time-warp multiplier, None = instant
         
         # Create robot
         self.robot = PythonRobot()
@@ -49,6 +55,7 @@ class WROPythonControl:
         self.console.namespace['levels'] = self.level_manager
         self.console.namespace['start_level'] = self.start_level
         self.console.namespace['check_objectives'] = self.check_level_objectives
+        self.console.namespace['speed'] = self.set_speed
         
         self.running = True
     
@@ -56,37 +63,70 @@ class WROPythonControl:
         """Start a specific level"""
         level = self.level_manager.get_level(level_id)
         if not level:
-            print(f"ERROR: Level {level_id} not found")
+            self.robot.events.emit(LEVEL, "ERROR: Level {} not found", level_id, level=ERROR)
             return f"Level {level_id} not found"
         
         if not self.level_manager.is_level_unlocked(level_id):
-            print(f"ERROR: Level {level_id} is locked")
+            self.robot.events.emit(LEVEL, "ERROR: Level {} is locked", level_id, level=ERROR)
             return f"Level {level_id} is locked"
         
         self.current_level = level
         self.game_state = "PLAYING"
         self.level_start_time = pygame.time.get_ticks() / 1000.0
+        self.timestep.reset()
         
         # Setup level environment
         self.setup_level_environment(level)
         
         # Reset robot for this level
         self.robot.reset_for_level(level)
+        level.track(self.robot)
 
         # Set callback for auto-checking objectives
         self.robot.objective_check_callback = self.auto_check_objectives
 
         return f"Started Level {level_id}: {level.name}"
     
+    def set_speed(self, multiplier=1) -> str:
+        """Set simulation speed: 1-1000 (x real time) or 'instant'"""
+        if multiplier in (None, 'instant'):
+            self.speed = None
+        elif isinstance(multiplier, (int, float)) and not math.isnan(multiplier):
+            self.speed = max(1, min(1000, multiplier))
+        else:
+            self.robot.events.emit(MESSAGE, "ERROR: Speed must be a number from 1 to 1000 or 'instant', got {!r}",
+                                   multiplier, level=ERROR)
+            return f"Invalid speed {multiplier!r}"
+
+        # Instant mode runs each command to completion as soon as it is given
+        self.robot.instant_motion = self.speed is None
+        if self.speed is None:
+            self.robot.settle()
+
+        label = "instant" if self.speed is None else f"{self.speed:g}x"
+        self.sidebar.speed_label = label
+        self.robot.events.emit(MESSAGE, ">> Simulation speed: {}", label)
+        return f"Speed {label}"
+
+    def cycle_speed(self):
+        """Step to the next entry in SPEED_LEVELS"""
+        if self.speed in SPEED_LEVELS:
+            index = (SPEED_LEVELS.index(self.speed) + 1) % len(SPEED_LEVELS)
+        else:
+            index = 0
+        self.set_speed(SPEED_LEVELS[index])
+
     def setup_level_environment(self, level):
         """Setup environment for specific level"""
-        # Set obstacles from level
-        self.robot.obstacles = level.obstacles.copy()
+        # Set obstacles from level (sharing the level's spatial index)
+        self.robot.set_obstacles(level.obstacles.copy(), level.get_obstacle_index(),
+                                 level.occupancy, level.distance_field)
         
         # Set items from level
         self.robot.items = level.items.copy()
         
-        print(f"🎮 Level environment loaded: {len(level.obstacles)} obstacles, {len(level.items)} items")
+        self.robot.events.emit(LEVEL, "🎮 Level environment loaded: {} obstacles, {} items",
+                               len(level.obstacles), len(level.items))
 
     def auto_check_objectives(self):
         """Automatically check objectives after robot movement"""
@@ -97,11 +137,12 @@ class WROPythonControl:
         from .core.constants import UNIT_SIZE, SIDEBAR_WIDTH
         robot_grid_x = (self.robot.x - SIDEBAR_WIDTH) / UNIT_SIZE
         robot_grid_y = self.robot.y / UNIT_SIZE
-        print(f"🤖 Robot at pixel ({self.robot.x:.1f}, {self.robot.y:.1f}) = grid ({robot_grid_x:.1f}, {robot_grid_y:.1f})")
+        self.robot.events.emit(OBJECTIVE, "🤖 Robot at pixel ({:.1f}, {:.1f}) = grid ({:.1f}, {:.1f})",
+                               self.robot.x, self.robot.y, robot_grid_x, robot_grid_y, level=DEBUG)
 
         if self.current_level.is_completed(self.robot):
-            print("🎯 OBJECTIVES COMPLETED!")
-            print("✨ Level completed automatically!")
+            self.robot.events.emit(OBJECTIVE, "🎯 OBJECTIVES COMPLETED!")
+            self.robot.events.emit(OBJECTIVE, "✨ Level completed automatically!")
             self.complete_level()
         else:
             # Check individual objectives and give feedback
@@ -110,12 +151,12 @@ class WROPythonControl:
             total_count = progress['total_objectives']
 
             if completed_count > 0:
-                print(f"📊 Progress: {completed_count}/{total_count} objectives completed")
+                self.robot.events.emit(OBJECTIVE, "📊 Progress: {}/{} objectives completed", completed_count, total_count)
 
                 # Show which objectives are completed
                 for obj_status in progress['objectives_status']:
                     if obj_status['completed']:
-                        print(f"✅ {obj_status['description']}")
+                        self.robot.events.emit(OBJECTIVE, "✅ {}", obj_status['description'])
             else:
                 # Show target info for debugging
                 for obj in self.current_level.objectives:
@@ -123,13 +164,14 @@ class WROPythonControl:
                         target = obj.params.get('target', (10, 10))
                         tolerance = obj.params.get('tolerance', 1.0)
                         distance = ((robot_grid_x - target[0])**2 + (robot_grid_y - target[1])**2)**0.5
-                        print(f"🎯 Target: {target}, Distance: {distance:.2f}, Tolerance: {tolerance}")
+                        self.robot.events.emit(OBJECTIVE, "🎯 Target: {}, Distance: {:.2f}, Tolerance: {}",
+                                               target, distance, tolerance, level=DEBUG)
                         break
 
     def check_level_objectives(self) -> bool:
         """Check if current level objectives are completed"""
         if not self.current_level:
-            print("ERROR: No level is currently active")
+            self.robot.events.emit(LEVEL, "ERROR: No level is currently active", level=ERROR)
             return False
         
         if self.current_level.is_completed(self.robot):
@@ -145,24 +187,23 @@ class WROPythonControl:
         if not self.current_level:
             return
         
-        # Calculate score and time
-        current_time = pygame.time.get_ticks() / 1000.0
-        time_taken = current_time - self.level_start_time if self.level_start_time else 0
+        # Calculate score and time (simulated, so results match on every machine)
+        time_taken = self.completion_time = self.robot.sim_time
         score = self.current_level.get_score(time_taken, self.robot)
         
         # Mark level as completed
         self.level_manager.complete_level(self.current_level.level_id, score, time_taken)
         
-        print(f"🎉 LEVEL {self.current_level.level_id} COMPLETED!")
-        print(f"⏱️  Time: {time_taken:.1f} seconds")
-        print(f"⭐ Score: {score}")
-        print(f"🤖 Commands used: {self.robot.commands_executed}")
-        print(f"📡 Sensor calls: {self.robot.sensor_calls}")
+        self.robot.events.emit(LEVEL, "🎉 LEVEL {} COMPLETED!", self.current_level.level_id)
+        self.robot.events.emit(LEVEL, "⏱️  Time: {:.1f} seconds", time_taken)
+        self.robot.events.emit(LEVEL, "⭐ Score: {}", score)
+        self.robot.events.emit(LEVEL, "🤖 Commands used: {}", self.robot.commands_executed)
+        self.robot.events.emit(LEVEL, "📡 Sensor calls: {}", self.robot.sensor_calls)
         
         # Check if next level is unlocked
         next_level = self.current_level.level_id + 1
         if next_level in self.level_manager.levels:
-            print(f"🔓 Level {next_level} unlocked!")
+            self.robot.events.emit(LEVEL, "🔓 Level {} unlocked!", next_level)
         
         self.game_state = "LEVEL_COMPLETE"
     
@@ -172,11 +213,11 @@ class WROPythonControl:
             return
         
         progress = self.current_level.get_progress(self.robot)
-        print(f"📊 Level {self.current_level.level_id} Progress:")
+        self.robot.events.emit(OBJECTIVE, "📊 Level {} Progress:", self.current_level.level_id)
         
         for obj_status in progress['objectives_status']:
             status = "✅" if obj_status['completed'] else "❌"
-            print(f"  {status} {obj_status['description']}")
+            self.robot.events.emit(OBJECTIVE, "  {} {}", status, obj_status['description'])
     
     def handle_events(self):
         """Handle pygame events based on game state"""
@@ -210,6 +251,9 @@ class WROPythonControl:
                     elif event.key == pygame.K_F2:
                         # Quick objective check
                         self.check_level_objectives()
+                    elif event.key == pygame.K_F3:
+                        # Cycle simulation speed (time warp)
+                        self.cycle_speed()
                     else:
                         # Pass key to console
                         self.console.handle_key(event.key, event.unicode)
@@ -226,18 +270,17 @@ class WROPythonControl:
                     self.console.handle_scroll(event.y)
     
     def update(self, dt: float):
-        """Update game state"""
+        """Advance the simulation by one fixed step"""
         if self.game_state == "PLAYING":
             self.robot.update(dt)
-            self.console.update(dt)
     
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
         """Draw everything based on game state"""
         if self.game_state == "LEVEL_SELECT":
             self.level_select_screen.draw(self.screen)
         
         elif self.game_state == "PLAYING":
-            self.draw_game()
+            self.draw_game(alpha)
         
         elif self.game_state == "LEVEL_COMPLETE":
             self.draw_level_complete()
@@ -247,13 +290,13 @@ class WROPythonControl:
 
         pygame.display.flip()
     
-    def draw_game(self):
-        """Draw the main game screen"""
+    def draw_game(self, alpha: float = 1.0):
+        """Draw the main game screen (robot interpolated by alpha)"""
         # Import game renderer here to avoid circular imports
         from .ui.game_renderer import GameRenderer
         
         renderer = GameRenderer(self.screen, self.font)
-        renderer.draw_game(self.robot, self.console, self.current_level, self.level_start_time, self.sidebar)
+        renderer.draw_game(self.robot, self.console, self.current_level, self.level_start_time, self.sidebar, alpha)
     
     def draw_level_complete(self):
         """Draw level completion screen"""
@@ -273,8 +316,7 @@ class WROPythonControl:
             self.screen.blit(level_text, level_rect)
             
             # Stats
-            current_time = pygame.time.get_ticks() / 1000.0
-            time_taken = current_time - self.level_start_time if self.level_start_time else 0
+            time_taken = self.completion_time
             score = self.current_level.get_score(time_taken, self.robot)
             
             stats = [
@@ -297,11 +339,14 @@ class WROPythonControl:
     def run(self):
         """Main game loop"""
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = self.clock.tick(FPS) / 1000.0
             
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            # Idle time still passes at 1x in instant mode
+            alpha = self.timestep.advance(frame_time, self.update, self.speed or 1)
+            if self.game_state == "PLAYING":
+                self.console.update(frame_time)
+            self.draw(alpha)
         
         pygame.quit()
 
@@ -8,6 +8,7 @@ import sys
 import time
 from io import StringIO
 from ..core.constants import *
+from ..core.program import CommandRecorder
 from .icon_manager import icon_manager
 
 
@@ -16,6 +17,7 @@ class PythonConsole:
     
     def __init__(self, robot):
         self.robot = robot
+        self.recorder = None  # CommandRecorder while optimizer mode is on
         self.command_history = []
         self.history_index = -1
         self.current_input = ""
@@ -35,6 +37,10 @@ class PythonConsole:
             ">>> "
         ]
         self.cursor_blink = 0
+        self.captured_output = None  # StringIO while a command is executing
+
+        # Robot events show up in the console in order with print() output
+        robot.events.subscribe(self.on_event)
         
         # Scroll functionality
         self.scroll_offset = 0
@@ -46,6 +52,7 @@ class PythonConsole:
             'robot': robot,
             'help': self.show_help,
             'clear': self.clear_console,
+            'optimizer': self.set_optimizer,
             'math': math,
             'time': time
         }
@@ -60,7 +67,7 @@ class PythonConsole:
         
         # Capture stdout
         old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
+        sys.stdout = self.captured_output = StringIO()
         
         try:
             # Execute the command
@@ -72,15 +79,18 @@ class PythonConsole:
                 exec(command, self.namespace)
             except Exception as e:
                 print(f"ERROR: {e}")
+
+        # Run the motion commands the optimizer buffered for this line
+        if self.recorder:
+            try:
+                self.recorder.flush()
+            except Exception as e:
+                print(f"ERROR: {e}")
         
-        # Restore stdout and get output
+        # Restore stdout and add the remaining output to the console
         sys.stdout = old_stdout
-        output = captured_output.getvalue()
-        
-        # Add output to console
-        if output.strip():
-            for line in output.strip().split('\n'):
-                self.output_lines.append(line)
+        self.flush_captured_output()
+        self.captured_output = None
 
         # Add new prompt for next command
         self.output_lines.append(">>> ")
@@ -91,6 +101,24 @@ class PythonConsole:
 
         self.scroll_to_bottom()
     
+    def flush_captured_output(self):
+        """Move print() output captured so far into the console lines"""
+        output = self.captured_output.getvalue()
+        if output.strip():
+            for line in output.strip().split('\n'):
+                self.output_lines.append(line)
+        self.captured_output.seek(0)
+        self.captured_output.truncate()
+
+    def on_event(self, event):
+        """Robot event subscriber; events are formatted only when drawn"""
+        if self.captured_output is None:
+            # Not from a console command (e.g. objective checks during animation)
+            print(event.text)
+            return
+        self.flush_captured_output()
+        self.output_lines.append(event)
+
     def show_help(self):
         """Show help information"""
         help_text = """
@@ -107,22 +135,30 @@ class PythonConsole:
   robot.front_sensor()      - Get front sensor only
   robot.left_sensor()       - Get left sensor only
   robot.right_sensor()      - Get right sensor only
+  robot.scan(36, 360)       - Lidar: (distances, angles) arrays
+  robot.clearance()         - Gap to the nearest obstacle
+  robot.plan_path(x, y)     - Shortest waypoints to (x, y)
+  robot.set_noise(0.1, 2, 0.05) - Noisy sensors/motors (returns seed)
 
 >> Navigation Commands:
   robot.move_to(x, y)       - Move to coordinates (x, y)
   robot.get_position()      - Get current position
   robot.face_direction(dir) - Face 'north', 'south', 'east', 'west'
   robot.collect()           - Collect nearby items
+  robot.nearest_item()      - Position of the closest item
   robot.avoid_obstacle()    - Smart obstacle avoidance
 
 >> Utility Commands:
   help()                    - Show this help
   clear()                   - Clear console
+  optimizer(True/False)     - Merge moves/turns before running
   robot.reset()             - Reset robot position
+  robot.undo() / redo()     - Undo or redo the last command
 
 >> Level Commands:
   check_objectives()        - Check current level progress
   start_level(n)           - Start level n (if unlocked)
+  speed(10) / speed('instant') - Fast-forward simulation (F3)
 
 >> Programming Tips:
   - Use loops: for i in range(4): robot.forward()
@@ -132,6 +168,12 @@ class PythonConsole:
 """
         print(help_text)
     
+    def set_optimizer(self, enabled: bool = True):
+        """Coalesce each command line's robot moves before running them"""
+        self.recorder = CommandRecorder(self.robot) if enabled else None
+        self.namespace['robot'] = self.recorder or self.robot
+        print(f">> Optimizer {'on' if enabled else 'off'}")
+
     def clear_console(self):
         """Clear console output"""
         self.output_lines = [">>> "]
@@ -238,7 +280,7 @@ class PythonConsole:
         
         # Calculate visible lines (exclude the last line if it's a prompt)
         total_lines = len(self.output_lines)
-        if total_lines > 0 and self.output_lines[-1].strip() == ">>>":
+        if total_lines > 0 and str(self.output_lines[-1]).strip() == ">>>":
             # Don't show the last line if it's just a prompt
             display_lines = total_lines - 1
         else:
@@ -249,7 +291,7 @@ class PythonConsole:
 
         # Draw visible lines
         for i in range(start_line, end_line):
-            line = self.output_lines[i]
+            line = str(self.output_lines[i])
             
             if y_offset > SCREEN_HEIGHT - 60:
                 break
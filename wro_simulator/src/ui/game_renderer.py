@@ -57,7 +57,7 @@ class GameRenderer:
         self.font = font
         self.icon_renderer = IconRenderer()
     
-    def draw_game(self, robot, console, current_level, level_start_time, sidebar):
+    def draw_game(self, robot, console, current_level, level_start_time, sidebar, alpha=1.0):
         """Draw the complete game screen with sidebar layout"""
         # Clear screen
         self.screen.fill(BACKGROUND)
@@ -77,7 +77,7 @@ class GameRenderer:
             self.draw_level_environment(current_level, robot)
 
         # Draw robot
-        self.draw_robot(robot)
+        self.draw_robot(robot, alpha)
 
         # Draw console
         console.draw(self.screen)
@@ -130,8 +130,11 @@ class GameRenderer:
             # Draw beautiful target point
             self.draw_target_point(target_center, robot_near_target, distance_to_target)
 
-        # Draw obstacles
-        for obstacle in level.obstacles:
+        # Draw obstacles inside the visible arena
+        visible_obstacles = level.get_obstacle_index().query_rect(
+            ARENA_LEFT, ARENA_TOP, ARENA_RIGHT - ARENA_LEFT, ARENA_BOTTOM - ARENA_TOP
+        )
+        for obstacle in visible_obstacles:
             obstacle_rect = pygame.Rect(
                 obstacle['x'], obstacle['y'],
                 obstacle['width'], obstacle['height']
@@ -235,10 +238,11 @@ class GameRenderer:
             dist_rect = dist_surface.get_rect(center=(center[0], center[1] + 40))
             self.screen.blit(dist_surface, dist_rect)
     
-    def draw_robot(self, robot):
+    def draw_robot(self, robot, alpha=1.0):
         """Draw beautiful, detailed robot with modern styling"""
-        robot_center = (int(robot.x), int(robot.y))
-        angle_rad = math.radians(robot.angle)
+        x, y, angle = robot.render_pose(alpha)
+        robot_center = (int(x), int(y))
+        angle_rad = math.radians(angle)
 
         # Enhanced shadow with gradient effect
         self.draw_robot_shadow(robot_center, robot.size)
@@ -131,7 +131,7 @@ class LevelSelectScreen:
         visible_levels = all_levels[self.scroll_offset:self.scroll_offset + max_visible_cards]
 
         for i, level_id in enumerate(visible_levels):
-            level = self.level_manager.get_level(level_id)
+            level = self.level_manager.get_info(level_id)
             is_unlocked = self.level_manager.is_level_unlocked(level_id)
             is_selected = level_id == self.selected_level
             
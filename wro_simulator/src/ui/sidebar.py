@@ -3,7 +3,6 @@ Sidebar UI Component for Robot Status and Level Info
 """
 
 import pygame
-import time
 from ..core.constants import *
 from .icon_manager import icon_manager
 
@@ -15,6 +14,7 @@ class Sidebar:
         self.font_large = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 20)
         self.font_small = pygame.font.Font(None, 16)
+        self.speed_label = "1x"  # simulation speed shown next to the clock
         
     def draw(self, screen, robot, current_level, level_start_time):
         """Draw the complete sidebar"""
@@ -36,7 +36,7 @@ class Sidebar:
         
         # Level info section
         if current_level:
-            y_offset = self.draw_level_info(screen, current_level, level_start_time, y_offset)
+            y_offset = self.draw_level_info(screen, current_level, robot.sim_time, y_offset)
             y_offset += 20
         
         # Objectives section
@@ -109,7 +109,7 @@ class Sidebar:
         
         return y + 18
     
-    def draw_level_info(self, screen, level, level_start_time, y_start):
+    def draw_level_info(self, screen, level, elapsed, y_start):
         """Draw level information section"""
         y = self.draw_section_header(screen, f"Level {level.level_id}", y_start, "star")
         
@@ -124,10 +124,9 @@ class Sidebar:
         screen.blit(diff_text, (15, y))
         y += 18
         
-        # Time
-        if level_start_time:
-            elapsed = time.time() - level_start_time
-            time_text = self.font_small.render(f"Time: {elapsed:.1f}s", True, (200, 200, 200))
+        # Time (simulated seconds since the level started)
+        if elapsed is not None:
+            time_text = self.font_small.render(f"Time: {elapsed:.1f}s ({self.speed_label})", True, (200, 200, 200))
             screen.blit(time_text, (15, y))
             y += 18
         
@@ -222,6 +221,7 @@ class Sidebar:
         help_items = [
             "F1: Programming Guide",
             "F2: Check objectives",
+            "F3: Simulation speed",
             "ESC: Back to menu",
             "Mouse wheel: Scroll console",
             "",
@@ -0,0 +1,156 @@
+"""
+Core algorithm tests for WRO Robot Control System
+Compiled level round-trips, exact route ordering and swept collisions
+"""
+
+import itertools
+import math
+import random
+
+import pytest
+
+from src.core.constants import *
+from src.core.geometry import circle_rect_overlap, sweep_circle_rect
+from src.core.level_file import CompiledLevel, compiled_path, load_level_file, save_level_file
+from src.core.level_manager import LevelManager
+from src.core.orienteering import OrienteeringSolver, turn_time
+from src.core.routing import RouteOptimizer, held_karp, tour_length
+
+LEVELS = LevelManager(manifest_file=None)
+
+
+def free_points(level, count, rng):
+    """Random points where the robot fits in the level"""
+    graph = level.visibility_graph
+    points = []
+    while len(points) < count:
+        point = (rng.uniform(ARENA_LEFT, ARENA_RIGHT), rng.uniform(ARENA_TOP, ARENA_BOTTOM))
+        if graph.is_free(*point):
+            points.append(point)
+    return points
+
+
+def level_state(level):
+    return {
+        'info': (level.level_id, level.name, level.description, level.difficulty),
+        'obstacles': level.obstacles,
+        'items': level.items,
+        'target_area': level.target_area,
+        'hints': level.hints,
+        'objectives': [(o.type, o.description, o.params) for o in level.objectives],
+    }
+
+
+@pytest.mark.parametrize('level_id', sorted(LEVELS.levels))
+def test_compiled_level_round_trip(tmp_path, level_id):
+    original = LEVELS.get_level(level_id)
+    path = str(tmp_path / f'level_{level_id:02d}.json')
+    save_level_file(original, path)
+
+    parsed = load_level_file(path)
+    assert isinstance(parsed.source, dict)
+    assert (tmp_path / f'level_{level_id:02d}.wrol').exists()
+
+    compiled = load_level_file(path)
+    assert isinstance(compiled.source, CompiledLevel)
+    assert level_state(compiled) == level_state(parsed)
+    assert level_state(parsed) == level_state(LEVELS.get_level(level_id))
+
+
+def test_compiled_level_rebuilt_when_corrupt(tmp_path):
+    path = str(tmp_path / 'level.json')
+    save_level_file(LEVELS.get_level(1), path)
+    load_level_file(path)
+    with open(compiled_path(path), 'r+b') as f:
+        f.write(b'junk')
+
+    level = load_level_file(path)
+    assert isinstance(level.source, dict)
+    assert isinstance(load_level_file(path).source, CompiledLevel)
+
+
+@pytest.mark.parametrize('n', range(9))
+def test_held_karp_matches_brute_force(n):
+    rng = random.Random(n)
+    for end in (None, n + 1):
+        size = n + 2
+        dist = [[0.0 if a == b else rng.uniform(1, 100) for b in range(size)] for a in range(size)]
+        best = min(tour_length(dist, order, end) for order in itertools.permutations(range(1, n + 1)))
+        order = held_karp(dist, n, end)
+        assert sorted(order) == list(range(1, n + 1))
+        assert tour_length(dist, order, end) == pytest.approx(best)
+
+
+@pytest.mark.parametrize('level_id', [1, 4, 6])
+def test_route_optimizer_is_exact_on_levels(level_id):
+    level = LEVELS.get_level(level_id)
+    optimizer = RouteOptimizer(level.visibility_graph)
+    rng = random.Random(level_id)
+    start, *stops = free_points(level, 7, rng)
+
+    order, length = optimizer.solve(start, stops)
+    points = [start] + stops
+    dist = optimizer.matrix(points)
+    reachable = [i for i in range(1, len(points)) if dist[0][i] < math.inf]
+    best = min(tour_length(dist, perm, None) for perm in itertools.permutations(reachable))
+    assert length == pytest.approx(best)
+    assert tour_length(dist, [i + 1 for i in order], None) == pytest.approx(length)
+
+
+@pytest.mark.parametrize('level_id', [1, 6])
+def test_orienteering_matches_brute_force(level_id):
+    level = LEVELS.get_level(level_id)
+    solver = OrienteeringSolver(RouteOptimizer(level.visibility_graph))
+    rng = random.Random(level_id)
+    start, *stops, end = free_points(level, 7, rng)
+    points = [start] + stops + [end]
+
+    def plan_time(order):
+        node, facing, total = 0, 0.0, 0.0
+        for j in list(order) + [len(points) - 1]:
+            leg = solver.leg(points[node], points[j])
+            if leg is None:
+                return math.inf
+            total += turn_time(facing, leg[0]) + leg[2]
+            node, facing = j, leg[1] if leg[1] is not None else facing
+        return total
+
+    for time_limit in (2.0, 4.0, 6.0, 25.0):
+        best_value, best_time = 0, math.inf
+        for size in range(len(stops) + 1):
+            for order in itertools.permutations(range(1, len(stops) + 1), size):
+                total = plan_time(order)
+                if total <= time_limit and (size > best_value or (size == best_value and total < best_time)):
+                    best_value, best_time = size, total
+
+        order, value, predicted = solver.solve(start, stops, time_limit, end=end)
+        assert value == best_value
+        assert predicted == pytest.approx(best_time)
+        assert plan_time([i + 1 for i in order]) == pytest.approx(predicted)
+
+
+def test_sweep_matches_sampling():
+    rng = random.Random(7)
+    rect = {'x': 100, 'y': 100, 'width': 60, 'height': 30}
+    radius = ROBOT_SIZE
+    steps = 2000
+    for _ in range(500):
+        x0, y0 = rng.uniform(0, 260), rng.uniform(0, 230)
+        if circle_rect_overlap(x0, y0, radius, rect):
+            continue
+        if rng.random() < 0.5:
+            dx, dy = rng.uniform(-150, 150), rng.uniform(-150, 150)
+        else:  # aimed near the box, so most of these make contact
+            dx, dy = rng.uniform(60, 200) - x0, rng.uniform(75, 155) - y0
+        sampled = next((i / steps for i in range(steps + 1)
+                        if circle_rect_overlap(x0 + dx * i / steps, y0 + dy * i / steps, radius, rect)), None)
+
+        t = sweep_circle_rect(x0, y0, dx, dy, radius, rect)
+        if sampled is None:
+            # The sampling may step over a grazing contact, never the sweep
+            assert t is None or not circle_rect_overlap(x0 + dx * (t + 1e-6), y0 + dy * (t + 1e-6),
+                                                        radius - 0.01, rect)
+        else:
+            assert t is not None
+            assert sampled - 1 / steps <= t <= sampled + 1e-9
+            assert not circle_rect_overlap(x0 + dx * t, y0 + dy * t, radius - 1e-6, rect)